@@ -7,12 +7,23 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
+from contextlib import closing, contextmanager
 from dataclasses import dataclass, field
+from itertools import accumulate
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Literal, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple
 
 _DB_PATH = "projects.db"
 _DB_INITIALIZED = False
+# (database path, names); saves run on a worker thread, so access goes through the lock and
+# a list read before the latest invalidation is not stored.
+_PROJECT_NAMES_CACHE: Optional[Tuple[str, List[str]]] = None
+_PROJECT_NAMES_GENERATION = 0
+_PROJECT_NAMES_LOCK = threading.Lock()
+# Incremented on every material write so callers can tell whether a loaded list is stale.
+_MATERIALS_VERSION = 0
 
 
 # ---------------------------------------------------------------------------
@@ -84,8 +95,11 @@ def _ensure_db() -> None:
         return
 
     Path(_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(_DB_PATH) as conn:
+    with closing(sqlite3.connect(_DB_PATH)) as conn, conn:
         conn.execute("PRAGMA foreign_keys = ON")
+        # WAL is stored in the database file, so setting it once here is enough;
+        # close_database() switches back when the application exits.
+        conn.execute("PRAGMA journal_mode = WAL")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS materials (
@@ -122,11 +136,34 @@ def _ensure_db() -> None:
     _DB_INITIALIZED = True
 
 
-def _get_connection() -> sqlite3.Connection:
+def close_database() -> None:
+    """Checkpoint the WAL and switch back to a rollback journal on shutdown."""
+
+    global _DB_INITIALIZED
+    if not _DB_INITIALIZED:
+        return
+    try:
+        with closing(sqlite3.connect(_DB_PATH)) as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("PRAGMA journal_mode = DELETE")
+    except sqlite3.Error:
+        # Another instance still has the database open and cleans up when it exits.
+        pass
+    _DB_INITIALIZED = False
+
+
+@contextmanager
+def _get_connection() -> Iterator[sqlite3.Connection]:
+    """Yield a connection for one transaction and close it afterwards."""
+
     _ensure_db()
-    conn = sqlite3.connect(_DB_PATH)
-    conn.execute("PRAGMA foreign_keys = ON")
-    return conn
+    with closing(sqlite3.connect(_DB_PATH)) as conn:
+        conn.execute("PRAGMA foreign_keys = ON")
+        # With WAL, NORMAL only syncs at checkpoints; a crash can lose the last commit but
+        # never corrupts the database.
+        conn.execute("PRAGMA synchronous = NORMAL")
+        with conn:
+            yield conn
 
 
 # ---------------------------------------------------------------------------
@@ -148,6 +185,7 @@ def create_material(name: str, notes: Optional[str] = None, k_const: Optional[fl
             (name.strip(), notes, k_const),
         )
         material_id = cursor.lastrowid
+    _bump_materials_version()
     return int(material_id)
 
 
@@ -186,7 +224,10 @@ def update_material(
             f"UPDATE materials SET {', '.join(fields)} WHERE id = ?",
             values,
         )
-        return cursor.rowcount > 0
+    if cursor.rowcount == 0:
+        return False
+    _bump_materials_version()
+    return True
 
 
 def delete_material(material_id: int) -> bool:
@@ -194,7 +235,10 @@ def delete_material(material_id: int) -> bool:
 
     with _get_connection() as conn:
         cursor = conn.execute("DELETE FROM materials WHERE id = ?", (material_id,))
-        return cursor.rowcount > 0
+    if cursor.rowcount == 0:
+        return False
+    _bump_materials_version()
+    return True
 
 
 def _fetch_material_points(conn: sqlite3.Connection, material_ids: Sequence[int]) -> Dict[int, List[Tuple[float, float]]]:
@@ -249,13 +293,40 @@ def get_material(material_id: int) -> Material:
     return Material(id=row[0], name=row[1], notes=row[2], k_const=row[3], k_points=points)
 
 
+def get_materials(material_ids: Iterable[int]) -> Dict[int, Material]:
+    """Load several materials by id with one query; unknown ids are left out."""
+
+    ids = list(dict.fromkeys(material_ids))
+    if not ids:
+        return {}
+    placeholders = ",".join("?" for _ in ids)
+    with _get_connection() as conn:
+        cursor = conn.execute(
+            f"SELECT id, name, notes, k_const FROM materials WHERE id IN ({placeholders})",
+            tuple(ids),
+        )
+        rows = cursor.fetchall()
+        point_map = _fetch_material_points(conn, [row[0] for row in rows])
+
+    return {
+        row[0]: Material(
+            id=row[0],
+            name=row[1],
+            notes=row[2],
+            k_const=row[3],
+            k_points=point_map.get(row[0], []),
+        )
+        for row in rows
+    }
+
+
 def upsert_k_points(material_id: int, points: Iterable[Tuple[float, float]]) -> None:
     """Replace the k(T) support points for a material."""
 
     cleaned: List[Tuple[float, float]] = []
     seen: set[float] = set()
 
-    for T_C, k_W_mK in sorted(points, key=lambda item: item[0]):
+    for T_C, k_W_mK in sorted(points, key=itemgetter(0)):
         if k_W_mK <= 0:
             raise ValueError("Thermal conductivity values must be positive.")
         if T_C in seen:
@@ -273,6 +344,18 @@ def upsert_k_points(material_id: int, points: Iterable[Tuple[float, float]]) ->
                 "INSERT INTO material_k_points (material_id, T_C, k_W_mK) VALUES (?, ?, ?)",
                 ((material_id, T_C, k_W_mK) for T_C, k_W_mK in cleaned),
             )
+    _bump_materials_version()
+
+
+def _bump_materials_version() -> None:
+    global _MATERIALS_VERSION
+    _MATERIALS_VERSION += 1
+
+
+def materials_version() -> int:
+    """Return a counter that changes whenever materials are written through this module."""
+
+    return _MATERIALS_VERSION
 
 
 # ---------------------------------------------------------------------------
@@ -280,6 +363,11 @@ def upsert_k_points(material_id: int, points: Iterable[Tuple[float, float]]) ->
 # ---------------------------------------------------------------------------
 
 
+# Compact separators keep the stored layers_json small; the layer dicts are flat, so the
+# circular-reference check is not needed either.
+_LAYERS_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), check_circular=False)
+
+
 def _layer_to_dict(layer: Layer) -> Dict[str, object]:
     return {
         "thickness_mm": layer.thickness_mm,
@@ -302,6 +390,13 @@ def _layer_from_dict(data: Dict[str, object]) -> Layer:
     )
 
 
+def _invalidate_project_names() -> None:
+    global _PROJECT_NAMES_CACHE, _PROJECT_NAMES_GENERATION
+    with _PROJECT_NAMES_LOCK:
+        _PROJECT_NAMES_CACHE = None
+        _PROJECT_NAMES_GENERATION += 1
+
+
 def save_project(project: Project) -> None:
     """Store a project in the database."""
 
@@ -312,7 +407,7 @@ def save_project(project: Project) -> None:
     if project.h_W_m2K <= 0:
         raise ValueError("Convective heat transfer coefficient must be positive.")
 
-    layers_json = json.dumps([_layer_to_dict(layer) for layer in project.layers])
+    layers_json = _LAYERS_JSON_ENCODER.encode([_layer_to_dict(layer) for layer in project.layers])
 
     with _get_connection() as conn:
         conn.execute(
@@ -333,6 +428,7 @@ def save_project(project: Project) -> None:
                 project.h_W_m2K,
             ),
         )
+    _invalidate_project_names()
 
 
 def load_project(name: str) -> Project:
@@ -362,13 +458,30 @@ def load_project(name: str) -> Project:
 def delete_project(name: str) -> bool:
     with _get_connection() as conn:
         cursor = conn.execute("DELETE FROM projects WHERE name = ?", (name,))
-        return cursor.rowcount > 0
+        deleted = cursor.rowcount > 0
+    if deleted:
+        _invalidate_project_names()
+    return deleted
 
 
 def get_all_project_names() -> List[str]:
+    """Return all project names, cached until the next save or delete."""
+
+    global _PROJECT_NAMES_CACHE
+    db_path = _DB_PATH
+    with _PROJECT_NAMES_LOCK:
+        cached = _PROJECT_NAMES_CACHE
+        generation = _PROJECT_NAMES_GENERATION
+    if cached is not None and cached[0] == db_path:
+        return list(cached[1])
+
     with _get_connection() as conn:
         cursor = conn.execute("SELECT name FROM projects ORDER BY name")
-        return [row[0] for row in cursor.fetchall()]
+        names = [row[0] for row in cursor.fetchall()]
+    with _PROJECT_NAMES_LOCK:
+        if generation == _PROJECT_NAMES_GENERATION:
+            _PROJECT_NAMES_CACHE = (db_path, names)
+    return list(names)
 
 
 # ---------------------------------------------------------------------------
@@ -380,7 +493,7 @@ def interp_k(material: Material, T_C: float, *, mode: str = "clamp") -> float:
     """Piece-wise linear interpolation for a material's thermal conductivity."""
 
     if material.k_points:
-        points = sorted(material.k_points, key=lambda item: item[0])
+        points = sorted(material.k_points, key=itemgetter(0))
         if mode != "clamp":
             raise ValueError("Only 'clamp' interpolation mode is currently supported.")
         if len(points) == 1:
@@ -470,9 +583,7 @@ def _solve_constant_k(
         current_T -= q * R
         interface_temperatures.append(current_T)
 
-    x_m = [0.0]
-    for thickness in thickness_m:
-        x_m.append(x_m[-1] + thickness)
+    x_m = list(accumulate(thickness_m, initial=0.0))
 
     T_profile = interface_temperatures.copy()
 
@@ -585,15 +696,13 @@ def solve_multilayer_kT(
         R = dx / k_const
         T_profile.append(T_profile[-1] - q * R)
 
-    x_m = [0.0]
-    for dx in cell_dx:
-        x_m.append(x_m[-1] + dx)
+    x_m = list(accumulate(cell_dx, initial=0.0))
 
     def _interp_material_k(material: Material, T_C: float) -> float:
         if clamp:
             return interp_k(material, T_C, mode="clamp")
 
-        points = sorted(material.k_points, key=lambda item: item[0])
+        points = sorted(material.k_points, key=itemgetter(0))
         if not points:
             if material.k_const is None:
                 raise ValueError(
@@ -657,14 +766,17 @@ __all__ = [
     "Layer",
     "Material",
     "Project",
+    "close_database",
     "compute_multilayer_layers",
     "create_material",
     "delete_material",
     "get_all_project_names",
     "get_material",
+    "get_materials",
     "interp_k",
     "list_materials",
     "load_project",
+    "materials_version",
     "save_project",
     "solve_multilayer_kT",
     "update_material",
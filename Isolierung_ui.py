@@ -5,35 +5,164 @@ from __future__ import annotations
 import csv
 import io
 import math
+import sqlite3
+import threading
 import tkinter as tk
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from tkinter import filedialog, messagebox, ttk
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
-
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.colors import LinearSegmentedColormap
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-from matplotlib import cm
-from matplotlib.patches import Patch
-from matplotlib.figure import Figure
+import numpy as np
 
 from Isolierung_logic import (
     Layer,
     Material,
     Project,
+    close_database,
     compute_multilayer_layers,
     create_material,
     delete_material,
     get_all_project_names,
     get_material,
+    get_materials,
     list_materials,
     load_project,
+    materials_version,
     save_project,
     solve_multilayer_kT,
     update_material,
     upsert_k_points,
 )
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+
+_MPL_CONFIGURED = False
+# Small charts do not need print resolution.
+_PLOT_DPI = 80
+
+
+# ---------------------------------------------------------------------------
+# Matplotlib setup
+# ---------------------------------------------------------------------------
+
+
+def _ensure_matplotlib() -> None:
+    """Configure matplotlib once before the first figure is created."""
+
+    global _MPL_CONFIGURED
+    if _MPL_CONFIGURED:
+        return
+
+    import matplotlib
+
+    # No backend is selected; FigureCanvasTkAgg does not need one.
+    matplotlib.rcParams.update(
+        {
+            "path.simplify": True,
+            "path.simplify_threshold": 1.0,
+            "agg.path.chunksize": 10000,
+        }
+    )
+    _MPL_CONFIGURED = True
+
+
+def _preload_matplotlib() -> None:
+    """Import matplotlib and load its font cache; runs in a thread, so no Tk calls."""
+
+    from matplotlib import font_manager
+
+    font_manager.findfont(font_manager.FontProperties())
+    _layer_colors(1)
+
+
+@lru_cache(maxsize=None)
+def _layer_colors(count: int) -> Tuple[Tuple[float, float, float, float], ...]:
+    """Return ``count`` evenly spaced tab20 RGBA colours for the layer spans."""
+
+    from matplotlib import colormaps
+
+    # colormaps[...] hands out a fresh copy on every lookup, so sample it once per count.
+    rgba = colormaps["tab20"](np.linspace(0.0, 1.0, count))
+    return tuple(tuple(color) for color in rgba.tolist())
+
+
+def _axes_limits(ax: Axes) -> Tuple[float, float, float, float]:
+    return (*ax.get_xlim(), *ax.get_ylim())
+
+
+def _limits_close(old: Sequence[float], new: Sequence[float]) -> bool:
+    """Compare axis limits, ignoring the last-bit jitter of relim/autoscale_view."""
+
+    return all(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-12) for a, b in zip(old, new))
+
+
+def _refit_range(
+    current: Tuple[float, float], low: float, high: float, margin: float = 0.1
+) -> Optional[Tuple[float, float]]:
+    """Return padded limits if ``[low, high]`` left the view or fills less than half of it."""
+
+    span = high - low
+    pad = span * margin if span > 0 else (abs(low) * margin or 1.0)
+    target = (low - pad, high + pad)
+    # matplotlib rejects non-finite limits.
+    if not (math.isfinite(target[0]) and math.isfinite(target[1])):
+        return None
+    current_low, current_high = current
+    if (
+        low < current_low
+        or high > current_high
+        or target[1] - target[0] < 0.5 * (current_high - current_low)
+    ):
+        return target
+    return None
+
+
+def _parse_optional_float(text: str) -> Optional[float]:
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+# Tcl lambda for ``apply``: append (T, k) pairs from a flat list to a Treeview in a single
+# round-trip and return the generated item ids.
+_TCL_INSERT_ROWS = (
+    "{tree values} {"
+    " set ids {};"
+    " foreach {T k} $values {lappend ids [$tree insert {} end -values [list $T $k]]};"
+    " return $ids"
+    "}"
+)
+
+
+@contextmanager
+def _batched_tree_update(tree: ttk.Treeview) -> Iterator[None]:
+    """Hide all columns while ``tree`` is refilled so Tk lays out the rows only once."""
+
+    display_columns = tree.cget("displaycolumns")
+    tree.configure(displaycolumns=())
+    try:
+        yield
+    finally:
+        tree.configure(displaycolumns=display_columns)
+
 
 # ---------------------------------------------------------------------------
 # Helper dataclasses
@@ -48,6 +177,100 @@ class _MaterialFormData:
     k_points: List[Tuple[float, float]]
 
 
+@dataclass
+class _PointRow:
+    """Python-side copy of one (T, k) table row; ``None`` marks a non-numeric cell."""
+
+    T_text: str
+    k_text: str
+    T: Optional[float]
+    k: Optional[float]
+
+    @classmethod
+    def from_text(cls, T_text: str, k_text: str) -> "_PointRow":
+        T_text, k_text = T_text.strip(), k_text.strip()
+        return cls(T_text, k_text, _parse_optional_float(T_text), _parse_optional_float(k_text))
+
+
+# ---------------------------------------------------------------------------
+# Layer table storage
+# ---------------------------------------------------------------------------
+
+# Column name -> value used when a row does not provide it. Columns starting with "_"
+# cache values derived from the others; ``None`` means "not computed yet".
+_LAYER_COLUMNS: Dict[str, object] = {
+    "mode": "material",
+    "material_id": None,
+    "material_name": "",
+    "use_kT": False,
+    "k_const": "",
+    "thickness": "",
+    "note": "",
+    "_thickness_parsed": None,
+    "_k_const_parsed": None,
+    "_tree_values": None,
+    "_layer_result": None,
+}
+
+
+class _LayerRow:
+    """Dict-like view of one row of a :class:`_LayerRows` table."""
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns: Dict[str, List[object]], index: int) -> None:
+        self._columns = columns
+        self._index = index
+
+    def __getitem__(self, key: str) -> object:
+        return self._columns[key][self._index]
+
+    def __setitem__(self, key: str, value: object) -> None:
+        self._columns[key][self._index] = value
+
+    def get(self, key: str, default: object = None) -> object:
+        column = self._columns.get(key)
+        return default if column is None else column[self._index]
+
+
+class _LayerRows:
+    """Layer stack of the calculation tab, stored as one list per column."""
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, List[object]] = {name: [] for name in _LAYER_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.columns["mode"])
+
+    def __getitem__(self, index: int) -> _LayerRow:
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return _LayerRow(self.columns, index)
+
+    def __delitem__(self, index: int) -> None:
+        for column in self.columns.values():
+            del column[index]
+
+    def __iter__(self) -> Iterator[_LayerRow]:
+        return (_LayerRow(self.columns, index) for index in range(len(self)))
+
+    def append(self, row: Dict[str, object]) -> None:
+        self.extend((row,))
+
+    def extend(self, rows: Iterable[Dict[str, object]]) -> None:
+        rows = list(rows)
+        for name, default in _LAYER_COLUMNS.items():
+            self.columns[name].extend([row.get(name, default) for row in rows])
+
+    def swap(self, first: int, second: int) -> None:
+        for column in self.columns.values():
+            column[first], column[second] = column[second], column[first]
+
+    def clear(self) -> None:
+        for column in self.columns.values():
+            column.clear()
+
+
 # ---------------------------------------------------------------------------
 # Material management tab
 # ---------------------------------------------------------------------------
@@ -58,15 +281,25 @@ class MaterialTab:
 
     def __init__(self, notebook: ttk.Notebook):
         self.root = notebook.winfo_toplevel()
+        self.notebook = notebook
         self.frame = ttk.Frame(notebook)
         notebook.add(self.frame, text="Materialien")
 
         self.materials: List[Material] = []
         self.material_by_id: Dict[int, Material] = {}
+        # Lowercased names parallel to ``materials`` for the search filter.
+        self._name_lower: List[str] = []
         self.current_material_id: Optional[int] = None
+        self._replot_after_id: Optional[str] = None
+        # Shadow of the points table keyed by Treeview iid. Rows are only ever appended at
+        # the end, so the dict order matches the tree order.
+        self._points_data: Dict[str, _PointRow] = {}
+        # Set when a replot was skipped because the tab was hidden.
+        self._plot_dirty = False
 
         self._build_layout()
         self.refresh_materials(preserve_selection=False)
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
 
     # ------------------------------------------------------------------
     # UI construction
@@ -88,7 +321,7 @@ class MaterialTab:
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         search_entry.pack(side=tk.LEFT, fill="x", expand=True, padx=(5, 0))
-        self.search_var.trace_add("write", lambda *_: self.refresh_materials())
+        self.search_var.trace_add("write", lambda *_: self.filter_materials())
 
         columns = ("name", "k_const", "points")
         self.tree = ttk.Treeview(
@@ -139,7 +372,7 @@ class MaterialTab:
         self.k_const_var = tk.StringVar()
         k_entry = ttk.Entry(k_row, textvariable=self.k_const_var)
         k_entry.pack(side=tk.LEFT, fill="x", expand=True, padx=(5, 0))
-        self.k_const_var.trace_add("write", lambda *_: self.update_plot())
+        self.k_const_var.trace_add("write", lambda *_: self._schedule_update_plot())
 
         ttk.Label(form_frame, text="Notizen:").pack(anchor="w")
         self.notes_text = tk.Text(form_frame, height=4)
@@ -161,6 +394,11 @@ class MaterialTab:
         self.points_tree.column("k", width=80, anchor=tk.CENTER)
         self.points_tree.pack(fill="both", expand=True, padx=4, pady=4)
         self.points_tree.bind("<Double-1>", self._edit_point_cell)
+        # A single editor entry is reused for every cell and only placed while editing.
+        self._cell_entry = ttk.Entry(self.points_tree)
+        self._cell_entry.bind("<Return>", self._commit_point_cell)
+        self._cell_entry.bind("<FocusOut>", self._commit_point_cell)
+        self._cell_edit: Optional[Tuple[str, str, str]] = None  # (row id, column, old text)
 
         point_button_frame = ttk.Frame(points_frame)
         point_button_frame.pack(fill="x", padx=4, pady=(0, 4))
@@ -182,13 +420,12 @@ class MaterialTab:
             side=tk.LEFT, padx=2
         )
 
-        # Plot
-        plot_frame = ttk.LabelFrame(form_frame, text="k(T) Verlauf")
-        plot_frame.pack(fill="both", expand=True, pady=(6, 0))
-        self.plot_figure = Figure(figsize=(5, 3), dpi=100)
-        self.plot_ax = self.plot_figure.add_subplot(111)
-        self.plot_canvas = FigureCanvasTkAgg(self.plot_figure, master=plot_frame)
-        self.plot_canvas.get_tk_widget().pack(fill="both", expand=True)
+        # The figure is created when the tab is first shown (see _build_plot).
+        self.plot_frame = ttk.LabelFrame(form_frame, text="k(T) Verlauf")
+        self.plot_frame.pack(fill="both", expand=True, pady=(6, 0))
+        self._plot_placeholder = ttk.Label(self.plot_frame, text="Lade Diagramm...")
+        self._plot_placeholder.pack(fill="both", expand=True)
+        self._plot_ready = False
 
         # Save/Reset buttons
         action_frame = ttk.Frame(form_frame)
@@ -200,13 +437,46 @@ class MaterialTab:
             side=tk.LEFT, padx=2
         )
 
+    def _build_plot(self) -> None:
+        _ensure_matplotlib()
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        self._plot_placeholder.destroy()
+        self.plot_figure = Figure(figsize=(500 / _PLOT_DPI, 300 / _PLOT_DPI), dpi=_PLOT_DPI)
+        self.plot_ax = self.plot_figure.add_subplot(111)
+        self.plot_figure.subplots_adjust(left=0.14, right=0.97, bottom=0.16, top=0.95)
+        self.plot_ax.set_xlabel("Temperatur [°C]")
+        self.plot_ax.set_ylabel("k [W/mK]")
+        self.plot_ax.grid(True, linestyle="--", alpha=0.6)
+        # Lines and overlays are animated and blitted over a cached background.
+        (self._plot_line,) = self.plot_ax.plot(
+            [], [], color="C0", marker="o", linewidth=2, animated=True
+        )
+        (self._plot_const_line,) = self.plot_ax.plot(
+            [], [], color="C0", linestyle="--", animated=True
+        )
+        self._plot_empty_text = self.plot_ax.text(
+            0.5,
+            0.5,
+            "Keine Daten",
+            ha="center",
+            va="center",
+            transform=self.plot_ax.transAxes,
+            animated=True,
+        )
+        self._plot_bg: Optional[object] = None
+        self.plot_canvas = FigureCanvasTkAgg(self.plot_figure, master=self.plot_frame)
+        self.plot_canvas.mpl_connect("draw_event", self._capture_plot_bg)
+        self.plot_canvas.get_tk_widget().pack(fill="both", expand=True)
+        self._plot_ready = True
+
     # ------------------------------------------------------------------
     # Tree handling
     # ------------------------------------------------------------------
 
     def refresh_materials(self, preserve_selection: bool = True) -> None:
-        search_term = self.search_var.get().strip().lower()
-        previous_id = self.current_material_id if preserve_selection else None
+        """Reload the materials from the database and show them in the tree."""
 
         try:
             self.materials = list_materials()
@@ -215,29 +485,36 @@ class MaterialTab:
             self.materials = []
 
         self.material_by_id = {mat.id: mat for mat in self.materials if mat.id is not None}
+        self._name_lower = [mat.name.lower() for mat in self.materials]
+        self.filter_materials(preserve_selection)
 
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def filter_materials(self, preserve_selection: bool = True) -> None:
+        """Refill the tree from the loaded materials that match the search term."""
 
-        for material in self.materials:
-            if search_term and search_term not in material.name.lower():
-                continue
-            k_const_display = (
-                f"{material.k_const:.4g}" if material.k_const is not None else ""
-            )
-            item_id = str(material.id) if material.id is not None else ""
-            self.tree.insert(
-                "",
-                tk.END,
-                iid=item_id or material.name,
-                values=(material.name, k_const_display, len(material.k_points)),
-            )
+        search_term = self.search_var.get().strip().lower()
+        previous_id = self.current_material_id if preserve_selection else None
 
-        if previous_id is not None and str(previous_id) in self.tree.get_children(""):
+        children: List[str] = []
+        with _batched_tree_update(self.tree):
+            self.tree.delete(*self.tree.get_children())
+            for material, name_lower in zip(self.materials, self._name_lower):
+                if search_term and search_term not in name_lower:
+                    continue
+                item_id = str(material.id) if material.id is not None else ""
+                children.append(
+                    self.tree.insert(
+                        "",
+                        tk.END,
+                        iid=item_id or material.name,
+                        values=self._material_tree_values(material),
+                    )
+                )
+
+        if previous_id is not None and str(previous_id) in children:
             self.tree.selection_set(str(previous_id))
             self.tree.focus(str(previous_id))
-        elif self.tree.get_children(""):
-            first = self.tree.get_children("")[0]
+        elif children:
+            first = children[0]
             self.tree.selection_set(first)
             self.tree.focus(first)
             self._on_tree_select()
@@ -249,17 +526,83 @@ class MaterialTab:
         if not selection:
             return
         iid = selection[0]
-        material = self.material_by_id.get(int(iid)) if iid.isdigit() else None
-        if material is None and iid:
-            try:
-                material = get_material(int(iid))
-            except Exception as exc:  # pragma: no cover - GUI feedback only
-                messagebox.showerror("Fehler", f"Material konnte nicht geladen werden: {exc}")
-                return
-        if material is None:
+        try:
+            material = self._get_material_cached(int(iid))
+        except Exception as exc:  # pragma: no cover - GUI feedback only
+            messagebox.showerror("Fehler", f"Material konnte nicht geladen werden: {exc}")
             return
         self.load_material(material)
 
+    @staticmethod
+    def _material_tree_values(material: Material) -> Tuple[str, str, int]:
+        k_const_display = f"{material.k_const:.4g}" if material.k_const is not None else ""
+        return material.name, k_const_display, len(material.k_points)
+
+    def _apply_material_change(self, material_id: int) -> None:
+        """Reload one material and patch the list and tree in place."""
+
+        try:
+            material = get_material(material_id)
+        except Exception:  # pragma: no cover - fall back to a full reload
+            self.refresh_materials()
+            return
+
+        # Keep ``materials`` in the ORDER BY name order of list_materials().
+        self._drop_material(material_id)
+        index = bisect_left(self.materials, material.name, key=attrgetter("name"))
+        name_lower = material.name.lower()
+        self.materials.insert(index, material)
+        self._name_lower.insert(index, name_lower)
+        self.material_by_id[material_id] = material
+
+        search_term = self.search_var.get().strip().lower()
+        iid = str(material_id)
+        if search_term and search_term not in name_lower:
+            if self.tree.exists(iid):
+                self.tree.delete(iid)
+            return
+
+        position = sum(
+            1 for name in self._name_lower[:index] if not search_term or search_term in name
+        )
+        values = self._material_tree_values(material)
+        if self.tree.exists(iid):
+            self.tree.item(iid, values=values)
+            self.tree.move(iid, "", position)
+        else:
+            self.tree.insert("", position, iid=iid, values=values)
+
+    def _drop_material(self, material_id: int) -> None:
+        known = self.material_by_id.get(material_id)
+        if known is not None:
+            # Names are unique and sorted, so the cached name finds the entry directly.
+            index = bisect_left(self.materials, known.name, key=attrgetter("name"))
+            if index < len(self.materials) and self.materials[index].id == material_id:
+                del self.materials[index]
+                del self._name_lower[index]
+                return
+        for index, mat in enumerate(self.materials):
+            if mat.id == material_id:
+                del self.materials[index]
+                del self._name_lower[index]
+                return
+
+    def _remove_material_row(self, material_id: int) -> None:
+        self._drop_material(material_id)
+        self.material_by_id.pop(material_id, None)
+        iid = str(material_id)
+        if self.tree.exists(iid):
+            self.tree.delete(iid)
+
+    def _get_material_cached(self, material_id: int) -> Material:
+        """Return a material from ``material_by_id``, loading it on a cache miss."""
+
+        material = self.material_by_id.get(material_id)
+        if material is None:
+            material = get_material(material_id)
+            self.material_by_id[material_id] = material
+        return material
+
     # ------------------------------------------------------------------
     # Editor handling
     # ------------------------------------------------------------------
@@ -274,11 +617,29 @@ class MaterialTab:
         self._fill_points(material.k_points)
         self.update_plot()
 
-    def _fill_points(self, points: Sequence[Tuple[float, float]]) -> None:
-        for item in self.points_tree.get_children():
-            self.points_tree.delete(item)
-        for T, k in points:
-            self.points_tree.insert("", tk.END, values=(str(T), str(k)))
+    def _fill_points(self, points: Sequence[Tuple[object, object]]) -> None:
+        with _batched_tree_update(self.points_tree):
+            self.points_tree.delete(*self.points_tree.get_children())
+            self._points_data.clear()
+            self._insert_point_rows((str(T), str(k)) for T, k in points)
+
+    def _insert_point_row(self, T_text: str, k_text: str) -> None:
+        row = _PointRow.from_text(T_text, k_text)
+        iid = self.points_tree.insert("", tk.END, values=(row.T_text, row.k_text))
+        self._points_data[iid] = row
+
+    def _insert_point_rows(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """Append rows to the points tree with one Tcl call."""
+
+        rows = [_PointRow.from_text(T_text, k_text) for T_text, k_text in pairs]
+        if not rows:
+            return
+        values = tuple(text for row in rows for text in (row.T_text, row.k_text))
+        tk_app = self.points_tree.tk
+        iids = tk_app.splitlist(
+            tk_app.call("apply", _TCL_INSERT_ROWS, str(self.points_tree), values)
+        )
+        self._points_data.update(zip(iids, rows))
 
     def prepare_new_material(self) -> None:
         self.current_material_id = None
@@ -306,7 +667,7 @@ class MaterialTab:
             messagebox.showerror("Fehler", "Ungültige Auswahl für Duplikation.")
             return
         try:
-            material = get_material(int(iid))
+            material = self._get_material_cached(int(iid))
         except Exception as exc:  # pragma: no cover - GUI feedback only
             messagebox.showerror("Fehler", f"Material konnte nicht geladen werden: {exc}")
             return
@@ -327,8 +688,8 @@ class MaterialTab:
             messagebox.showerror("Fehler", f"Duplizieren fehlgeschlagen: {exc}")
             return
 
-        self.refresh_materials(preserve_selection=False)
-        if str(new_id) in self.tree.get_children(""):
+        self._apply_material_change(new_id)
+        if self.tree.exists(str(new_id)):
             self.tree.selection_set(str(new_id))
             self.tree.focus(str(new_id))
             self._on_tree_select()
@@ -347,28 +708,27 @@ class MaterialTab:
         ):
             return
         try:
-            if delete_material(int(iid)):
-                messagebox.showinfo("Erfolg", "Material gelöscht.")
-            else:
-                messagebox.showwarning("Hinweis", "Material konnte nicht gelöscht werden.")
+            deleted = delete_material(int(iid))
         except Exception as exc:  # pragma: no cover - GUI feedback only
             messagebox.showerror("Fehler", f"Löschen fehlgeschlagen: {exc}")
             return
 
-        self.refresh_materials(preserve_selection=False)
+        if deleted:
+            self._remove_material_row(int(iid))
+            messagebox.showinfo("Erfolg", "Material gelöscht.")
+        else:
+            messagebox.showwarning("Hinweis", "Material konnte nicht gelöscht werden.")
         self.prepare_new_material()
 
     def reset_editor(self) -> None:
         if self.current_material_id is None:
             self.prepare_new_material()
             return
-        material = self.material_by_id.get(self.current_material_id)
-        if material is None:
-            try:
-                material = get_material(self.current_material_id)
-            except Exception as exc:  # pragma: no cover - GUI feedback only
-                messagebox.showerror("Fehler", f"Material konnte nicht geladen werden: {exc}")
-                return
+        try:
+            material = self._get_material_cached(self.current_material_id)
+        except Exception as exc:  # pragma: no cover - GUI feedback only
+            messagebox.showerror("Fehler", f"Material konnte nicht geladen werden: {exc}")
+            return
         self.load_material(material)
 
     # ------------------------------------------------------------------
@@ -376,13 +736,14 @@ class MaterialTab:
     # ------------------------------------------------------------------
 
     def add_point_row(self) -> None:
-        self.points_tree.insert("", tk.END, values=("", ""))
+        self._insert_point_row("", "")
 
     def remove_point_rows(self) -> None:
         selection = self.points_tree.selection()
+        self.points_tree.delete(*selection)
         for iid in selection:
-            self.points_tree.delete(iid)
-        self.update_plot()
+            self._points_data.pop(iid, None)
+        self._schedule_update_plot()
 
     def _edit_point_cell(self, event: tk.Event) -> None:  # pragma: no cover - UI only
         region = self.points_tree.identify("region", event.x, event.y)
@@ -392,23 +753,37 @@ class MaterialTab:
         column = self.points_tree.identify_column(event.x)
         if not row_id or column not in {"#1", "#2"}:
             return
+        self._commit_point_cell()
         x, y, width, height = self.points_tree.bbox(row_id, column)
-        value = self.points_tree.set(row_id, column)
+        row = self._points_data[row_id]
+        value = row.T_text if column == "#1" else row.k_text
+        self._cell_edit = (row_id, column, value)
 
-        entry = ttk.Entry(self.points_tree)
+        entry = self._cell_entry
+        entry.delete(0, tk.END)
         entry.insert(0, value)
         entry.select_range(0, tk.END)
-        entry.focus()
         entry.place(x=x, y=y, width=width, height=height)
+        entry.focus_set()
 
-        def commit(event: tk.Event | None = None) -> None:
-            new_value = entry.get().strip()
-            self.points_tree.set(row_id, column, new_value)
-            entry.destroy()
-            self.update_plot()
-
-        entry.bind("<Return>", commit)
-        entry.bind("<FocusOut>", commit)
+    def _commit_point_cell(self, _event: tk.Event | None = None) -> None:  # pragma: no cover - UI only
+        if self._cell_edit is None:
+            # Return followed by the resulting FocusOut only commits once.
+            return
+        row_id, column, value = self._cell_edit
+        self._cell_edit = None
+        new_value = self._cell_entry.get().strip()
+        self._cell_entry.place_forget()
+        row = self._points_data.get(row_id)
+        if row is None or new_value == value:
+            return
+        if column == "#1":
+            new_row = _PointRow.from_text(new_value, row.k_text)
+        else:
+            new_row = _PointRow.from_text(row.T_text, new_value)
+        self._points_data[row_id] = new_row
+        self.points_tree.item(row_id, values=(new_row.T_text, new_row.k_text))
+        self._schedule_update_plot()
 
     def paste_points(self) -> None:
         try:
@@ -416,21 +791,17 @@ class MaterialTab:
         except tk.TclError:
             messagebox.showwarning("Hinweis", "Keine Daten in der Zwischenablage.")
             return
-        reader = csv.reader(io.StringIO(text), delimiter="\t")
-        added = False
-        for row in reader:
-            if not row:
-                continue
-            if len(row) == 1:
-                parts = list(csv.reader([row[0]], delimiter=","))[0]
-            else:
-                parts = row
-            if len(parts) < 2:
-                continue
-            self.points_tree.insert("", tk.END, values=(parts[0].strip(), parts[1].strip()))
-            added = True
-        if added:
-            self.update_plot()
+        # Spreadsheet copies are tab separated, hand-written lists usually use commas.
+        sample = next((line for line in text.splitlines() if line.strip()), "")
+        delimiter = "\t" if "\t" in sample else ","
+        points = [
+            (row[0], row[1])
+            for row in csv.reader(io.StringIO(text), delimiter=delimiter)
+            if len(row) >= 2
+        ]
+        if points:
+            self._insert_point_rows(points)
+            self._schedule_update_plot()
 
     def import_csv(self) -> None:
         file_path = filedialog.askopenfilename(
@@ -439,22 +810,21 @@ class MaterialTab:
         )
         if not file_path:
             return
+        points: List[Tuple[str, str]] = []
         try:
-            with open(file_path, newline="", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-                rows = list(reader)
+            with open(file_path, newline="", encoding="utf-8", buffering=1 << 16) as csvfile:
+                for row in csv.reader(csvfile):
+                    if len(row) < 2:
+                        continue
+                    T_str, k_str = row[0].strip(), row[1].strip()
+                    if T_str and k_str:
+                        points.append((T_str, k_str))
         except Exception as exc:  # pragma: no cover - file IO
             messagebox.showerror("Fehler", f"CSV konnte nicht gelesen werden: {exc}")
             return
 
-        self._fill_points(
-            [
-                (row[0].strip(), row[1].strip())
-                for row in rows
-                if len(row) >= 2 and row[0].strip() and row[1].strip()
-            ]
-        )
-        self.update_plot()
+        self._fill_points(points)
+        self._schedule_update_plot()
 
     def export_csv(self) -> None:
         file_path = filedialog.asksaveasfilename(
@@ -465,18 +835,16 @@ class MaterialTab:
         if not file_path:
             return
         try:
-            with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-                for T_str, k_str in self._iter_point_strings():
-                    writer.writerow([T_str, k_str])
+            with open(
+                file_path, "w", newline="", encoding="utf-8", buffering=1 << 20
+            ) as csvfile:
+                csv.writer(csvfile).writerows(self._iter_point_strings())
         except Exception as exc:  # pragma: no cover - file IO
             messagebox.showerror("Fehler", f"CSV konnte nicht gespeichert werden: {exc}")
 
     def _iter_point_strings(self) -> Iterable[Tuple[str, str]]:
-        for iid in self.points_tree.get_children():
-            values = self.points_tree.item(iid, "values")
-            if len(values) >= 2:
-                yield str(values[0]).strip(), str(values[1]).strip()
+        for row in self._points_data.values():
+            yield row.T_text, row.k_text
 
     # ------------------------------------------------------------------
     # Saving and validation
@@ -505,29 +873,26 @@ class MaterialTab:
 
         points: List[Tuple[float, float]] = []
         seen_T: set[float] = set()
-        for T_str, k_str in self._iter_point_strings():
-            if not T_str and not k_str:
-                continue
-            try:
-                T_val = float(T_str)
-            except ValueError:
-                messagebox.showerror("Fehler", f"Temperatur '{T_str}' ist ungültig.")
+        for row in self._points_data.values():
+            if row.T is None:
+                if not row.T_text and not row.k_text:
+                    continue
+                messagebox.showerror("Fehler", f"Temperatur '{row.T_text}' ist ungültig.")
                 return None
-            try:
-                k_val = float(k_str)
-            except ValueError:
-                messagebox.showerror("Fehler", f"k-Wert '{k_str}' ist ungültig.")
+            if row.k is None:
+                messagebox.showerror("Fehler", f"k-Wert '{row.k_text}' ist ungültig.")
                 return None
-            if k_val <= 0:
+            if row.k <= 0:
                 messagebox.showerror("Fehler", "k-Werte müssen positiv sein.")
                 return None
-            if T_val in seen_T:
+            # Checked per row, so the first problem in table order is the one reported.
+            if row.T in seen_T:
                 messagebox.showerror("Fehler", "Keine doppelten Temperaturwerte erlaubt.")
                 return None
-            seen_T.add(T_val)
-            points.append((T_val, k_val))
+            seen_T.add(row.T)
+            points.append((row.T, row.k))
 
-        points.sort(key=lambda item: item[0])
+        points.sort(key=itemgetter(0))
 
         return _MaterialFormData(name=name, notes=notes, k_const=k_const_value, k_points=points)
 
@@ -564,10 +929,10 @@ class MaterialTab:
             messagebox.showerror("Fehler", f"Speichern fehlgeschlagen: {exc}")
             return
 
-        self.refresh_materials()
         if self.current_material_id is not None:
+            self._apply_material_change(self.current_material_id)
             iid = str(self.current_material_id)
-            if iid in self.tree.get_children(""):
+            if self.tree.exists(iid):
                 self.tree.selection_set(iid)
                 self.tree.focus(iid)
         self.update_plot()
@@ -576,42 +941,119 @@ class MaterialTab:
     # Plot rendering
     # ------------------------------------------------------------------
 
+    def _schedule_update_plot(self) -> None:
+        """Coalesce bursts of edits (typing, cell commits) into one deferred replot."""
+
+        if self._replot_after_id is not None:
+            self.root.after_cancel(self._replot_after_id)
+            self._replot_after_id = None
+        if not self._plot_visible():
+            self._plot_dirty = True
+            return
+        self._replot_after_id = self.root.after(80, self._run_update_plot)
+
+    def _run_update_plot(self) -> None:
+        self._replot_after_id = None
+        self.update_plot()
+
     def update_plot(self) -> None:
-        points: List[Tuple[float, float]] = []
-        for T_str, k_str in self._iter_point_strings():
-            try:
-                T_val = float(T_str)
-                k_val = float(k_str)
-            except ValueError:
-                continue
-            if k_val <= 0:
-                continue
-            points.append((T_val, k_val))
-        points.sort(key=lambda item: item[0])
+        if self._replot_after_id is not None:
+            # An explicit redraw supersedes a pending deferred one.
+            self.root.after_cancel(self._replot_after_id)
+            self._replot_after_id = None
+        if not self._plot_visible():
+            self._plot_dirty = True
+            return
+        self._plot_dirty = False
+        if not self._plot_ready:
+            self._build_plot()
+
+        values = np.array(
+            [
+                (row.T, row.k)
+                for row in self._points_data.values()
+                if row.T is not None and row.k is not None
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+        T_values, k_values = values[:, 0], values[:, 1]
+        valid = np.isfinite(T_values) & np.isfinite(k_values) & (k_values > 0)
+        T_values, k_values = T_values[valid], k_values[valid]
+        order = np.argsort(T_values, kind="stable")
 
         try:
             k_const_value = float(self.k_const_var.get()) if self.k_const_var.get() else None
         except ValueError:
             k_const_value = None
 
-        self.plot_ax.clear()
-        self.plot_ax.set_xlabel("Temperatur [°C]")
-        self.plot_ax.set_ylabel("k [W/mK]")
-        self.plot_ax.grid(True, linestyle="--", alpha=0.6)
-
-        if points:
-            temps, ks = zip(*points)
-            self.plot_ax.plot(temps, ks, marker="o", linewidth=2)
-        elif k_const_value is not None and not math.isnan(k_const_value):
-            temps = [0.0, 100.0]
-            ks = [k_const_value, k_const_value]
-            self.plot_ax.plot(temps, ks, linestyle="--")
+        bounds: Optional[Tuple[float, float, float, float]] = None
+        if order.size:
+            T_sorted = T_values[order]
+            self._plot_line.set_data(T_sorted, k_values[order])
+            self._plot_const_line.set_data([], [])
+            bounds = (
+                float(T_sorted[0]),
+                float(T_sorted[-1]),
+                float(k_values.min()),
+                float(k_values.max()),
+            )
+        elif k_const_value is not None and math.isfinite(k_const_value):
+            self._plot_line.set_data([], [])
+            self._plot_const_line.set_data([0.0, 100.0], [k_const_value, k_const_value])
+            bounds = (0.0, 100.0, k_const_value, k_const_value)
         else:
-            self.plot_ax.text(0.5, 0.5, "Keine Daten", ha="center", va="center", transform=self.plot_ax.transAxes)
+            self._plot_line.set_data([], [])
+            self._plot_const_line.set_data([], [])
+        has_data = bounds is not None
+
+        limits_changed = False
+        if bounds is not None:
+            x_range = _refit_range(self.plot_ax.get_xlim(), bounds[0], bounds[1])
+            if x_range is not None:
+                self.plot_ax.set_xlim(x_range)
+                limits_changed = True
+            y_range = _refit_range(self.plot_ax.get_ylim(), bounds[2], bounds[3])
+            if y_range is not None:
+                self.plot_ax.set_ylim(y_range)
+                limits_changed = True
+
+        if (
+            self._plot_bg is not None
+            and self._plot_empty_text.get_visible() != has_data
+            and not limits_changed
+        ):
+            self.plot_canvas.restore_region(self._plot_bg)
+            self._draw_plot_lines()
+            self.plot_canvas.blit(self.plot_ax.bbox)
+            return
 
-        self.plot_figure.tight_layout()
+        # Limits or the placeholder changed: the background has to be re-rendered.
+        self._plot_empty_text.set_visible(not has_data)
+        self._plot_bg = None
         self.plot_canvas.draw_idle()
 
+    def _plot_visible(self) -> bool:
+        return self.notebook.select() == str(self.frame)
+
+    def _on_tab_changed(self, _event: tk.Event) -> None:
+        if not self._plot_visible():
+            return
+        if not self._plot_ready:
+            # Let Tk map the tab with the placeholder before building the figure.
+            self.root.after_idle(self.update_plot)
+        elif self._plot_dirty:
+            self.update_plot()
+
+    def _capture_plot_bg(self, _event: object) -> None:
+        # Runs after every full redraw (including resizes).
+        self._plot_bg = self.plot_canvas.copy_from_bbox(self.plot_ax.bbox)
+        self._draw_plot_lines()
+
+    def _draw_plot_lines(self) -> None:
+        self.plot_ax.draw_artist(self._plot_line)
+        self.plot_ax.draw_artist(self._plot_const_line)
+        self.plot_ax.draw_artist(self._plot_empty_text)
+
 
 # ---------------------------------------------------------------------------
 # Main application UI
@@ -628,9 +1070,24 @@ def run_ui() -> None:
             self.frame = ttk.Frame(notebook)
             notebook.add(self.frame, text="Berechnung")
 
-            self.layer_rows: List[Dict[str, object]] = []
+            self.layer_rows = _LayerRows()
             self.materials: List[Material] = []
             self.material_lookup: Dict[int, Material] = {}
+            self.material_by_name: Dict[str, Material] = {}
+            # materials_version() of the loaded list; None forces the next refresh to load.
+            self._materials_version: Optional[int] = None
+            # (id, name) pairs of the loaded materials.
+            self._materials_sig: Optional[Tuple[Tuple[Optional[int], str], ...]] = None
+            # Only tab switches and the refresh button reload the list, not "Berechnen".
+            self._auto_refresh_materials = False
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="solver")
+            # Saves get their own worker so they never wait for the solver.
+            self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+            # Built on first use, then only withdrawn and shown again.
+            self._save_dialog: Optional[tk.Toplevel] = None
+            self._save_close_after_id: Optional[str] = None
+            # Bumped each time the save dialog opens; see _poll_save.
+            self._save_session = 0
             self.material_names: List[str] = []
             self.mode_display: Dict[str, str] = {"material": "Material", "custom": "Custom"}
             self.mode_internal: Dict[str, str] = {v: k for k, v in self.mode_display.items()}
@@ -638,6 +1095,19 @@ def run_ui() -> None:
             self.form_updating = False
             self.form_enabled = False
             self.tree_items: List[str] = []
+            # Callbacks queued with _run_when_idle that have not run yet.
+            self._idle_pending: set[Callable[[], None]] = set()
+            self._pending_output_text: Optional[str] = None
+            # Values last written to each tree item, parallel to ``tree_items``.
+            self._row_cache: List[Tuple[str, ...]] = []
+            # Rows whose tree item is out of date; written by _flush_row_updates.
+            self._pending_rows: set[int] = set()
+            # Rows currently tagged "error".
+            self._error_indices: set[int] = set()
+            self._row_update_after_id: Optional[str] = None
+            self._validate_after_id: Optional[str] = None
+            # Raw (T_links, T_∞, h) texts and their parsed values from the last valid parse.
+            self._boundary_cache: Optional[Tuple[Tuple[str, str, str], Tuple[float, float, float]]] = None
 
             self._build_layout()
             self.refresh_material_options()
@@ -709,6 +1179,12 @@ def run_ui() -> None:
             self.btn_clear = ttk.Button(layer_button_frame, text="Leeren", command=self.clear_layers)
             self.btn_clear.pack(side=tk.LEFT, padx=8)
 
+            ttk.Button(
+                layer_button_frame,
+                text="Materialien aktualisieren",
+                command=lambda: self.refresh_material_options(force=True),
+            ).pack(side=tk.RIGHT, padx=2)
+
             control_frame = ttk.Frame(self.frame)
             control_frame.grid(row=0, column=1, sticky="nsew", padx=(0, 10), pady=10)
             control_frame.columnconfigure(0, weight=1)
@@ -752,41 +1228,51 @@ def run_ui() -> None:
             self.k_const_var = tk.StringVar()
             self.k_const_entry = ttk.Entry(editor_frame, textvariable=self.k_const_var, state="disabled")
             self.k_const_entry.grid(row=3, column=1, sticky="ew", padx=4, pady=2)
-            self.k_const_var.trace_add("write", lambda *_: self._on_value_change("k_const"))
+            k_const_trace = self.k_const_var.trace_add("write", lambda *_: self._on_value_change("k_const"))
 
             ttk.Label(editor_frame, text="Dicke [mm]:").grid(row=4, column=0, sticky="w", padx=4, pady=2)
             self.thickness_var = tk.StringVar()
             self.thickness_entry = ttk.Entry(editor_frame, textvariable=self.thickness_var, state="disabled")
             self.thickness_entry.grid(row=4, column=1, sticky="ew", padx=4, pady=2)
-            self.thickness_var.trace_add("write", lambda *_: self._on_value_change("thickness"))
+            thickness_trace = self.thickness_var.trace_add("write", lambda *_: self._on_value_change("thickness"))
 
             ttk.Label(editor_frame, text="Notiz:").grid(row=5, column=0, sticky="w", padx=4, pady=2)
             self.note_var = tk.StringVar()
             self.note_entry = ttk.Entry(editor_frame, textvariable=self.note_var, state="disabled")
             self.note_entry.grid(row=5, column=1, sticky="ew", padx=4, pady=2)
-            self.note_var.trace_add("write", lambda *_: self._on_value_change("note"))
+            note_trace = self.note_var.trace_add("write", lambda *_: self._on_value_change("note"))
+
+            # (variable, callback name) of the editor traces, see _set_value_traces.
+            self._value_traces: List[Tuple[tk.StringVar, str]] = [
+                (self.k_const_var, k_const_trace),
+                (self.thickness_var, thickness_trace),
+                (self.note_var, note_trace),
+            ]
 
             boundary_frame = ttk.LabelFrame(control_frame, text="Randbedingungen")
             boundary_frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))
             boundary_frame.columnconfigure(1, weight=1)
 
             self.T_left_var = tk.StringVar()
-            ttk.Label(boundary_frame, text="T_links [°C]:").grid(row=0, column=0, sticky="w", padx=4, pady=2)
-            ttk.Entry(boundary_frame, textvariable=self.T_left_var).grid(row=0, column=1, sticky="ew", padx=4, pady=2)
-
             self.T_inf_var = tk.StringVar()
-            ttk.Label(boundary_frame, text="T_∞ [°C]:").grid(row=1, column=0, sticky="w", padx=4, pady=2)
-            ttk.Entry(boundary_frame, textvariable=self.T_inf_var).grid(row=1, column=1, sticky="ew", padx=4, pady=2)
-
             self.h_var = tk.StringVar()
-            ttk.Label(boundary_frame, text="h [W/m²K]:").grid(row=2, column=0, sticky="w", padx=4, pady=2)
-            ttk.Entry(boundary_frame, textvariable=self.h_var).grid(row=2, column=1, sticky="ew", padx=4, pady=2)
+            boundary_fields = (
+                ("T_links [°C]:", self.T_left_var),
+                ("T_∞ [°C]:", self.T_inf_var),
+                ("h [W/m²K]:", self.h_var),
+            )
+            for row, (text, variable) in enumerate(boundary_fields):
+                ttk.Label(boundary_frame, text=text).grid(row=row, column=0, sticky="w", padx=4, pady=2)
+                ttk.Entry(boundary_frame, textvariable=variable).grid(
+                    row=row, column=1, sticky="ew", padx=4, pady=2
+                )
 
             action_frame = ttk.Frame(control_frame)
             action_frame.grid(row=2, column=0, sticky="ew", pady=(0, 10))
 
             self.btn_calculate = ttk.Button(action_frame, text="Berechnen", command=self.calculate)
             self.btn_calculate.pack(side=tk.LEFT, padx=4)
+            ttk.Button(action_frame, text="Alles prüfen", command=self.validate_all).pack(side=tk.LEFT, padx=4)
 
             ttk.Button(action_frame, text="Aus Projekt laden", command=self.open_load_dialog).pack(side=tk.LEFT, padx=4)
             ttk.Button(action_frame, text="Als Projekt speichern", command=self.open_save_dialog).pack(side=tk.LEFT, padx=4)
@@ -795,42 +1281,82 @@ def run_ui() -> None:
             self.output_text.grid(row=3, column=0, sticky="nsew")
             self.output_text.configure(state="disabled")
 
+            # The figure is created by the first plot (see _build_plot).
             self.plot_frame = ttk.Frame(self.frame)
             self.plot_frame.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=10, pady=(0, 10))
+            self._plot_placeholder = ttk.Label(
+                self.plot_frame, text="Das Temperaturprofil erscheint nach der ersten Berechnung."
+            )
+            self._plot_placeholder.pack(fill="both", expand=True)
+            self._plot_ready = False
+            # Per-layer artists (boundaries, spans) that are replaced when the layer stack changes.
+            self.plot_layer_artists: List[object] = []
+            self._plot_layer_key: Optional[Tuple[object, ...]] = None
+            self._legend_key: Optional[Tuple[str, ...]] = None
+            self._plot_legend: Optional[object] = None
+            self._plot_key: Optional[Tuple[object, ...]] = None
+            self._plot_background: Optional[object] = None
+
+            self._update_button_states()
 
-            self.plot_figure = Figure(figsize=(6, 3))
+        def _build_plot(self) -> None:
+            _ensure_matplotlib()
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.figure import Figure
+
+            self._plot_placeholder.destroy()
+            self.plot_figure = Figure(
+                figsize=(600 / _PLOT_DPI, 300 / _PLOT_DPI), dpi=_PLOT_DPI, layout="constrained"
+            )
             self.plot_ax = self.plot_figure.add_subplot(111)
             self.plot_ax.set_xlabel("x [m]")
             self.plot_ax.set_ylabel("T [°C]")
             self.plot_ax.set_title("Temperaturprofil")
             self.plot_ax.grid(True, linestyle="--", alpha=0.4)
+            # The profile line is animated and blitted over a cached background.
+            (self.plot_line,) = self.plot_ax.plot(
+                [], [], color="tab:red", label="Temperaturprofil", animated=True
+            )
 
             self.plot_canvas = FigureCanvasTkAgg(self.plot_figure, master=self.plot_frame)
-            self.plot_canvas.draw()
+            self.plot_canvas.mpl_connect("draw_event", self._on_plot_draw)
             self.plot_canvas.get_tk_widget().pack(fill="both", expand=True)
-
-            self._update_button_states()
+            self._plot_ready = True
 
         # ------------------------------------------------------------------
         # Layer management
         # ------------------------------------------------------------------
 
-        def refresh_material_options(self) -> None:
+        def refresh_material_options(self, force: bool = False) -> None:
+            version = materials_version()
+            if not force and version == self._materials_version:
+                return
             try:
                 materials = list_materials()
             except Exception as exc:
                 messagebox.showerror("Fehler", f"Materialien konnten nicht geladen werden: {exc}")
                 materials = []
+            else:
+                self._materials_version = version
 
             self.materials = materials
             self.material_lookup = {m.id: m for m in materials if m.id is not None}
+            self.material_by_name = {m.name: m for m in materials}
+
+            signature = tuple((m.id, m.name) for m in materials)
+            if signature == self._materials_sig:
+                return
+            self._materials_sig = signature
             self.material_names = [m.name for m in materials]
             self.material_combo.configure(values=self.material_names)
 
-            for row in self.layer_rows:
-                material_id = row.get("material_id")
+            columns = self.layer_rows.columns
+            material_names = columns["material_name"]
+            tree_values = columns["_tree_values"]
+            for index, material_id in enumerate(columns["material_id"]):
                 if isinstance(material_id, int) and material_id in self.material_lookup:
-                    row["material_name"] = self.material_lookup[material_id].name
+                    material_names[index] = self.material_lookup[material_id].name
+                    tree_values[index] = None
 
             for index in range(len(self.layer_rows)):
                 self._update_tree_row(index)
@@ -876,10 +1402,7 @@ def run_ui() -> None:
             new_index = self.selected_index + direction
             if not (0 <= new_index < len(self.layer_rows)):
                 return
-            self.layer_rows[self.selected_index], self.layer_rows[new_index] = (
-                self.layer_rows[new_index],
-                self.layer_rows[self.selected_index],
-            )
+            self.layer_rows.swap(self.selected_index, new_index)
             self.refresh_tree(select_index=new_index)
 
         def clear_layers(self) -> None:
@@ -891,12 +1414,26 @@ def run_ui() -> None:
         # ------------------------------------------------------------------
 
         def refresh_tree(self, select_index: Optional[int] = None) -> None:
-            self.tree.delete(*self.tree.get_children())
-            self.tree_items = []
-
-            for index in range(len(self.layer_rows)):
-                item = self.tree.insert("", tk.END, values=self._row_to_tree_values(index))
-                self.tree_items.append(item)
+            # Every row is compared below, which covers any pending per-row update.
+            self._cancel_row_updates()
+            # Items are reused by position; surplus items are inserted or deleted at the end.
+            new_values = [self._row_to_tree_values(index) for index in range(len(self.layer_rows))]
+            changed = [
+                index
+                for index, values in enumerate(new_values[: len(self.tree_items)])
+                if values != self._row_cache[index]
+            ]
+            if changed or len(new_values) != len(self.tree_items):
+                with _batched_tree_update(self.tree):
+                    for index in changed:
+                        self.tree.item(self.tree_items[index], values=new_values[index])
+                    if len(new_values) > len(self.tree_items):
+                        for values in new_values[len(self.tree_items) :]:
+                            self.tree_items.append(self.tree.insert("", tk.END, values=values))
+                    elif len(new_values) < len(self.tree_items):
+                        self.tree.delete(*self.tree_items[len(new_values) :])
+                        del self.tree_items[len(new_values) :]
+            self._row_cache = new_values
 
             self._clear_error_highlights()
 
@@ -905,7 +1442,9 @@ def run_ui() -> None:
 
             if select_index is not None and 0 <= select_index < len(self.layer_rows):
                 item_id = self.tree_items[select_index]
-                self.tree.selection_set(item_id)
+                # selection_set always fires <<TreeviewSelect>>, even for an unchanged selection.
+                if self.tree.selection() != (item_id,):
+                    self.tree.selection_set(item_id)
                 self.tree.focus(item_id)
                 self.selected_index = select_index
                 self._load_row_into_form(select_index)
@@ -914,66 +1453,128 @@ def run_ui() -> None:
                 self.selected_index = None
                 self._load_row_into_form(None)
 
-            self._update_button_states()
+            self._run_when_idle(self._update_button_states)
 
         def _update_tree_row(self, index: int) -> None:
             if 0 <= index < len(self.tree_items):
-                self.tree.item(self.tree_items[index], values=self._row_to_tree_values(index))
+                values = self._row_to_tree_values(index)
+                if values != self._row_cache[index]:
+                    self._row_cache[index] = values
+                    self.tree.item(self.tree_items[index], values=values)
+
+        def _schedule_row_update(self, index: int) -> None:
+            self.layer_rows.columns["_tree_values"][index] = None
+            self._pending_rows.add(index)
+            if self._row_update_after_id is not None:
+                self.root.after_cancel(self._row_update_after_id)
+            self._row_update_after_id = self.root.after(50, self._flush_row_updates)
+            if self._error_indices:
+                self._schedule_validation()
+
+        def _cancel_row_updates(self) -> None:
+            if self._row_update_after_id is not None:
+                self.root.after_cancel(self._row_update_after_id)
+                self._row_update_after_id = None
+            self._pending_rows.clear()
+
+        def _flush_row_updates(self) -> None:
+            pending = sorted(self._pending_rows)
+            self._cancel_row_updates()
+            if not pending:
+                return
+            for index in pending:
+                self._update_tree_row(index)
+
+        def _schedule_validation(self) -> None:
+            self._cancel_validation()
+            self._validate_after_id = self.root.after(150, self._run_validation)
+
+        def _cancel_validation(self) -> None:
+            if self._validate_after_id is not None:
+                self.root.after_cancel(self._validate_after_id)
+                self._validate_after_id = None
+
+        def _run_validation(self) -> None:
+            self._validate_after_id = None
+            if not self._error_indices:
+                return
+            _layers, _errors, error_indices = self._collect_layers()
+            self._highlight_errors(error_indices)
 
         def _row_to_tree_values(self, index: int) -> Tuple[str, ...]:
-            row = self.layer_rows[index]
-            mode = str(row.get("mode", "material"))
-            material_text = row.get("material_name", "") if mode == "material" else ""
-            use_kT_text = "Ja" if row.get("use_kT") else "Nein"
-            k_const_text = row.get("k_const", "") if mode == "custom" else ""
-            thickness_text = row.get("thickness", "")
-            note_text = row.get("note", "")
-            return (
-                str(index + 1),
-                self.mode_display.get(mode, mode),
-                material_text,
-                use_kT_text,
-                k_const_text,
-                thickness_text,
-                note_text,
-            )
+            columns = self.layer_rows.columns
+            # Cached without the order number; reset by _schedule_row_update.
+            display = columns["_tree_values"][index]
+            if display is None:
+                mode = str(columns["mode"][index])
+                material_text = columns["material_name"][index] if mode == "material" else ""
+                use_kT_text = "Ja" if columns["use_kT"][index] else "Nein"
+                k_const_text = columns["k_const"][index] if mode == "custom" else ""
+                thickness_text = columns["thickness"][index]
+                note_text = columns["note"][index]
+                display = (
+                    self.mode_display.get(mode, mode),
+                    material_text,
+                    use_kT_text,
+                    k_const_text,
+                    thickness_text,
+                    note_text,
+                )
+                columns["_tree_values"][index] = display
+            return (str(index + 1), *display)
 
         def _on_tree_select(self, _event: tk.Event) -> None:
             selection = self.tree.selection()
             if not selection:
                 self.selected_index = None
                 self._load_row_into_form(None)
-                self._update_button_states()
+                self._run_when_idle(self._update_button_states)
                 return
             item = selection[0]
             index = self.tree.index(item)
+            if index == self.selected_index and self.form_enabled:
+                # Selected by refresh_tree, which has already loaded the row into the form.
+                return
             self.selected_index = index
             self._load_row_into_form(index)
-            self._update_button_states()
+            self._run_when_idle(self._update_button_states)
+
+        def _set_value_traces(self, enabled: bool) -> None:
+            # Plain Tcl "trace add/remove" keeps the registered callbacks alive, unlike
+            # Variable.trace_remove, which deletes the command and would force re-registering.
+            action = "add" if enabled else "remove"
+            for variable, callback_name in self._value_traces:
+                self.root.tk.call("trace", action, "variable", str(variable), "write", callback_name)
 
         def _load_row_into_form(self, index: Optional[int]) -> None:
             self.form_updating = True
-            if index is None:
-                self.form_enabled = False
-                self.mode_var.set("")
-                self.material_var.set("")
-                self.use_kT_var.set(False)
-                self.k_const_var.set("")
-                self.thickness_var.set("")
-                self.note_var.set("")
-            else:
-                row = self.layer_rows[index]
-                self.form_enabled = True
-                mode_text = self.mode_display.get(str(row.get("mode", "material")), "Material")
-                self.mode_var.set(mode_text)
-                self.material_var.set(row.get("material_name", ""))
-                self.use_kT_var.set(bool(row.get("use_kT", False)))
-                self.k_const_var.set(str(row.get("k_const", "")))
-                self.thickness_var.set(str(row.get("thickness", "")))
-                self.note_var.set(str(row.get("note", "")))
-
-            self.form_updating = False
-            self._update_form_state()
+            # Loading a row must not write back into it.
+            self._set_value_traces(False)
+            try:
+                if index is None:
+                    self.form_enabled = False
+                    self.mode_var.set("")
+                    self.material_var.set("")
+                    self.use_kT_var.set(False)
+                    self.k_const_var.set("")
+                    self.thickness_var.set("")
+                    self.note_var.set("")
+                else:
+                    row = self.layer_rows[index]
+                    self.form_enabled = True
+                    mode_text = self.mode_display.get(str(row.get("mode", "material")), "Material")
+                    self.mode_var.set(mode_text)
+                    self.material_var.set(row.get("material_name", ""))
+                    self.use_kT_var.set(bool(row.get("use_kT", False)))
+                    self.k_const_var.set(str(row.get("k_const", "")))
+                    self.thickness_var.set(str(row.get("thickness", "")))
+                    self.note_var.set(str(row.get("note", "")))
+            finally:
+                # Re-attached even if a set fails, or the editor would stop writing to rows.
+                self._set_value_traces(True)
+                self.form_updating = False
+
+            self._run_when_idle(self._update_form_state)
 
         def _update_form_state(self) -> None:
             if not self.form_enabled:
@@ -1024,15 +1625,14 @@ def run_ui() -> None:
                 row["use_kT"] = False
                 self.use_kT_var.set(False)
 
-            self._update_form_state()
-            self._clear_error_highlights()
-            self._update_tree_row(self.selected_index)
+            self._run_when_idle(self._update_form_state)
+            self._schedule_row_update(self.selected_index)
 
         def _on_material_selected(self) -> None:
             if self.selected_index is None or self.form_updating:
                 return
             name = self.material_var.get()
-            material = next((m for m in self.materials if m.name == name), None)
+            material = self.material_by_name.get(name)
             if material is None:
                 return
             row = self.layer_rows[self.selected_index]
@@ -1041,17 +1641,15 @@ def run_ui() -> None:
             row["material_name"] = material.name
             if self.mode_var.get() != self.mode_display["material"]:
                 self.mode_var.set(self.mode_display["material"])
-            self._update_form_state()
-            self._clear_error_highlights()
-            self._update_tree_row(self.selected_index)
+            self._run_when_idle(self._update_form_state)
+            self._schedule_row_update(self.selected_index)
 
         def _on_use_kT_toggle(self) -> None:
             if self.selected_index is None or self.form_updating:
                 return
             row = self.layer_rows[self.selected_index]
             row["use_kT"] = bool(self.use_kT_var.get())
-            self._clear_error_highlights()
-            self._update_tree_row(self.selected_index)
+            self._schedule_row_update(self.selected_index)
 
         def _on_value_change(self, field: str) -> None:
             if self.selected_index is None or self.form_updating:
@@ -1065,8 +1663,19 @@ def run_ui() -> None:
             else:
                 return
             self.layer_rows[self.selected_index][field] = value
-            self._clear_error_highlights()
-            self._update_tree_row(self.selected_index)
+            self._schedule_row_update(self.selected_index)
+
+        def _run_when_idle(self, callback: Callable[[], None]) -> None:
+            """Run ``callback`` once in the next idle slot."""
+
+            if callback in self._idle_pending:
+                return
+            self._idle_pending.add(callback)
+            self.root.after_idle(self._run_idle_callback, callback)
+
+        def _run_idle_callback(self, callback: Callable[[], None]) -> None:
+            self._idle_pending.discard(callback)
+            callback()
 
         def _update_button_states(self) -> None:
             has_selection = self.selected_index is not None
@@ -1083,18 +1692,19 @@ def run_ui() -> None:
             self.btn_clear.configure(state="normal" if has_rows else "disabled")
 
         def _clear_error_highlights(self) -> None:
-            for item in self.tree_items:
-                tags = set(self.tree.item(item, "tags"))
-                if "error" in tags:
-                    tags.remove("error")
-                    self.tree.item(item, tags=tuple(tags))
+            self._highlight_errors(())
 
-        def _highlight_errors(self, indices: Sequence[int]) -> None:
-            for index in indices:
-                if 0 <= index < len(self.tree_items):
-                    tags = set(self.tree.item(self.tree_items[index], "tags"))
-                    tags.add("error")
-                    self.tree.item(self.tree_items[index], tags=tuple(tags))
+        def _highlight_errors(self, indices: Iterable[int]) -> None:
+            """Tag exactly ``indices`` as erroneous."""
+
+            wanted = {index for index in indices if 0 <= index < len(self.tree_items)}
+            for index in self._error_indices - wanted:
+                # Items past the end were deleted together with their rows.
+                if index < len(self.tree_items):
+                    self.tree.item(self.tree_items[index], tags=())
+            for index in wanted - self._error_indices:
+                self.tree.item(self.tree_items[index], tags=("error",))
+            self._error_indices = wanted
 
         # ------------------------------------------------------------------
         # Validation and calculation
@@ -1106,126 +1716,196 @@ def run_ui() -> None:
             except ValueError as exc:
                 raise ValueError(f"{field} muss eine Zahl sein.") from exc
 
+        def _parse_row_float(self, index: int, field: str, raw: str, label: str) -> float:
+            """Parse a row field, reusing the cached value while its raw text is unchanged."""
+
+            cache = self.layer_rows.columns[f"_{field}_parsed"]
+            cached = cache[index]
+            if cached is not None and cached[0] == raw:
+                return cached[1]
+            value = self._parse_float(raw, label)
+            cache[index] = (raw, value)
+            return value
+
+        def _prime_parse_cache(self, field: str, indices: Iterable[int]) -> None:
+            """Fill the parse cache of a column; if any cell fails, _parse_row_float reports it."""
+
+            columns = self.layer_rows.columns
+            texts = columns[field]
+            cache = columns[f"_{field}_parsed"]
+            stale: List[int] = []
+            raws: List[str] = []
+            for index in indices:
+                raw = str(texts[index]).strip()
+                cached = cache[index]
+                if cached is None or cached[0] != raw:
+                    stale.append(index)
+                    raws.append(raw)
+            if len(stale) < 2:
+                return
+            try:
+                values = np.char.replace(np.array(raws), ",", ".").astype(np.float64)
+            except ValueError:
+                return
+            for index, raw, value in zip(stale, raws, values.tolist()):
+                cache[index] = (raw, value)
+
         def _parse_boundary_conditions(self) -> Tuple[float, float, float]:
-            T_left = self._parse_float(self.T_left_var.get().strip(), "T_links")
-            T_inf = self._parse_float(self.T_inf_var.get().strip(), "T_∞")
-            h_value = self._parse_float(self.h_var.get().strip(), "h")
+            raw = (self.T_left_var.get().strip(), self.T_inf_var.get().strip(), self.h_var.get().strip())
+            cached = self._boundary_cache
+            if cached is not None and cached[0] == raw:
+                return cached[1]
+            T_left = self._parse_float(raw[0], "T_links")
+            T_inf = self._parse_float(raw[1], "T_∞")
+            h_value = self._parse_float(raw[2], "h")
             if h_value <= 0:
                 raise ValueError("h muss größer als 0 sein.")
+            self._boundary_cache = (raw, (T_left, T_inf, h_value))
             return T_left, T_inf, h_value
 
-        def _collect_layers(self) -> Tuple[List[Layer], List[str], List[int]]:
+        def _collect_layers(self, fail_fast: bool = False) -> Tuple[List[Layer], List[str], List[int]]:
+            """Validate all rows; with ``fail_fast`` stop at the first invalid row."""
+
             if not self.layer_rows:
                 return [], ["Mindestens eine Schicht ist erforderlich."], []
 
             layers: List[Layer] = []
             errors: List[str] = []
             error_indices: List[int] = []
+            columns = self.layer_rows.columns
+            results = columns["_layer_result"]
+            modes = columns["mode"]
+            self._prime_parse_cache("thickness", range(len(modes)))
+            self._prime_parse_cache("k_const", [i for i, mode in enumerate(modes) if mode == "custom"])
+
+            for index, row_inputs in enumerate(
+                zip(
+                    modes,
+                    columns["material_id"],
+                    columns["use_kT"],
+                    columns["k_const"],
+                    columns["thickness"],
+                    columns["note"],
+                )
+            ):
+                # A row is only validated again when one of its inputs or its material changed.
+                material = self.material_lookup.get(row_inputs[1]) if row_inputs[0] == "material" else None
+                key = (*row_inputs, material)
+                result = results[index]
+                if result is None or result[0] != key:
+                    result = (key, *self._validate_layer_row(index, *row_inputs))
+                    # A material that could not be loaded is looked up again next time.
+                    if row_inputs[0] != "material" or row_inputs[1] in self.material_lookup:
+                        results[index] = result
+                layer_obj, error = result[1], result[2]
+                if error is None:
+                    layers.append(layer_obj)
+                else:
+                    errors.append(f"Zeile {index + 1}: {error}")
+                    error_indices.append(index)
+                    if fail_fast:
+                        break
 
-            for index, row in enumerate(self.layer_rows):
-                mode = str(row.get("mode", "material"))
+            return layers, errors, error_indices
 
-                thickness_raw = str(row.get("thickness", "")).strip()
-                if not thickness_raw:
-                    errors.append(f"Zeile {index + 1}: Dicke muss angegeben werden.")
-                    error_indices.append(index)
-                    continue
-                try:
-                    thickness = self._parse_float(thickness_raw, "Dicke")
-                except ValueError as exc:
-                    errors.append(f"Zeile {index + 1}: {exc}")
-                    error_indices.append(index)
-                    continue
-                if thickness <= 0:
-                    errors.append(f"Zeile {index + 1}: Dicke muss größer als 0 sein.")
-                    error_indices.append(index)
-                    continue
+        def _validate_layer_row(
+            self,
+            index: int,
+            mode: object,
+            material_id: object,
+            use_kT: object,
+            k_const_text: object,
+            thickness_text: object,
+            note_text: object,
+        ) -> Tuple[Optional[Layer], Optional[str]]:
+            """Build the layer for one row, or return the error message for it."""
+
+            mode = str(mode)
+
+            thickness_raw = str(thickness_text).strip()
+            if not thickness_raw:
+                return None, "Dicke muss angegeben werden."
+            try:
+                thickness = self._parse_row_float(index, "thickness", thickness_raw, "Dicke")
+            except ValueError as exc:
+                return None, str(exc)
+            if thickness <= 0:
+                return None, "Dicke muss größer als 0 sein."
 
-                note = (str(row.get("note", "")).strip() or None)
+            note = (str(note_text).strip() or None)
 
-                if mode == "material":
-                    material_id = row.get("material_id")
-                    if not isinstance(material_id, int):
-                        errors.append(f"Zeile {index + 1}: Bitte ein Material auswählen.")
-                        error_indices.append(index)
-                        continue
-                    material = self.material_lookup.get(material_id)
-                    if material is None:
-                        try:
-                            material = get_material(material_id)
-                            self.material_lookup[material_id] = material
-                        except Exception:
-                            errors.append(
-                                f"Zeile {index + 1}: Material mit ID {material_id} ist nicht verfügbar."
-                            )
-                            error_indices.append(index)
-                            continue
-                    row["material_name"] = material.name
-                    use_kT = bool(row.get("use_kT", False))
-                    if use_kT and not material.k_points and material.k_const is None:
-                        errors.append(
-                            f"Zeile {index + 1}: Material '{material.name}' enthält keine k(T)-Daten."
-                        )
-                        error_indices.append(index)
-                        continue
-                    if not use_kT and material.k_const is None:
-                        errors.append(
-                            f"Zeile {index + 1}: Material '{material.name}' hat keinen konstanten k-Wert."
-                        )
-                        error_indices.append(index)
-                        continue
-                    try:
-                        layer_obj = Layer(
-                            thickness_mm=thickness,
-                            mode="material",
-                            material_id=material_id,
-                            use_kT=use_kT,
-                            k_const=None,
-                            note=note,
-                        )
-                    except ValueError as exc:
-                        errors.append(f"Zeile {index + 1}: {exc}")
-                        error_indices.append(index)
-                        continue
-                    layers.append(layer_obj)
-                else:
-                    if row.get("use_kT"):
-                        errors.append(f"Zeile {index + 1}: Custom-Schichten unterstützen kein k(T).")
-                        error_indices.append(index)
-                        continue
-                    k_const_raw = str(row.get("k_const", "")).strip()
-                    if not k_const_raw:
-                        errors.append(f"Zeile {index + 1}: k_const muss angegeben werden.")
-                        error_indices.append(index)
-                        continue
-                    try:
-                        k_const = self._parse_float(k_const_raw, "k_const")
-                    except ValueError as exc:
-                        errors.append(f"Zeile {index + 1}: {exc}")
-                        error_indices.append(index)
-                        continue
-                    if k_const <= 0:
-                        errors.append(f"Zeile {index + 1}: k_const muss größer als 0 sein.")
-                        error_indices.append(index)
-                        continue
+            if mode == "material":
+                if not isinstance(material_id, int):
+                    return None, "Bitte ein Material auswählen."
+                material = self.material_lookup.get(material_id)
+                if material is None:
                     try:
-                        layer_obj = Layer(
-                            thickness_mm=thickness,
-                            mode="custom",
-                            material_id=None,
-                            use_kT=False,
-                            k_const=k_const,
-                            note=note,
-                        )
-                    except ValueError as exc:
-                        errors.append(f"Zeile {index + 1}: {exc}")
-                        error_indices.append(index)
-                        continue
-                    layers.append(layer_obj)
+                        material = get_material(material_id)
+                    except KeyError:
+                        return None, f"Material mit ID {material_id} ist nicht verfügbar."
+                    except sqlite3.Error as exc:
+                        return None, f"Material konnte nicht geladen werden: {exc}"
+                    self.material_lookup[material_id] = material
+                columns = self.layer_rows.columns
+                if columns["material_name"][index] != material.name:
+                    columns["material_name"][index] = material.name
+                    columns["_tree_values"][index] = None
+                use_kT = bool(use_kT)
+                if use_kT and not material.k_points and material.k_const is None:
+                    return None, f"Material '{material.name}' enthält keine k(T)-Daten."
+                if not use_kT and material.k_const is None:
+                    return None, f"Material '{material.name}' hat keinen konstanten k-Wert."
+                try:
+                    layer_obj = Layer(
+                        thickness_mm=thickness,
+                        mode="material",
+                        material_id=material_id,
+                        use_kT=use_kT,
+                        k_const=None,
+                        note=note,
+                    )
+                except ValueError as exc:
+                    return None, str(exc)
+                return layer_obj, None
+
+            if use_kT:
+                return None, "Custom-Schichten unterstützen kein k(T)."
+            k_const_raw = str(k_const_text).strip()
+            if not k_const_raw:
+                return None, "k_const muss angegeben werden."
+            try:
+                k_const = self._parse_row_float(index, "k_const", k_const_raw, "k_const")
+            except ValueError as exc:
+                return None, str(exc)
+            if k_const <= 0:
+                return None, "k_const muss größer als 0 sein."
+            try:
+                layer_obj = Layer(
+                    thickness_mm=thickness,
+                    mode="custom",
+                    material_id=None,
+                    use_kT=False,
+                    k_const=k_const,
+                    note=note,
+                )
+            except ValueError as exc:
+                return None, str(exc)
+            return layer_obj, None
 
-            return layers, errors, error_indices
+        def validate_all(self) -> None:
+            self._cancel_validation()
+            self._flush_row_updates()
+            self.refresh_material_options()
+            _layers, errors, error_indices = self._collect_layers()
+            self._highlight_errors(error_indices)
+            if errors:
+                messagebox.showerror("Validierungsfehler", "\n".join(errors))
+            else:
+                messagebox.showinfo("Hinweis", "Alle Schichten sind gültig.")
 
         def calculate(self) -> None:
+            self._cancel_validation()
+            self._flush_row_updates()
             self._clear_error_highlights()
             try:
                 T_left, T_inf, h_value = self._parse_boundary_conditions()
@@ -1233,24 +1913,39 @@ def run_ui() -> None:
                 messagebox.showerror("Validierungsfehler", str(exc))
                 return
 
-            self.refresh_material_options()
+            if self._auto_refresh_materials:
+                self.refresh_material_options()
             layers, errors, error_indices = self._collect_layers()
             if errors:
                 self._highlight_errors(error_indices)
                 messagebox.showerror("Validierungsfehler", "\n".join(errors))
                 return
 
+            solver = (
+                solve_multilayer_kT
+                if any(layer.use_kT for layer in layers)
+                else compute_multilayer_layers
+            )
+            self.btn_calculate.configure(state="disabled")
+            future = self._executor.submit(solver, layers, T_left, T_inf, h_value)
+            self.root.after(30, self._poll_calculation, future, layers, T_inf)
+
+        def _poll_calculation(
+            self, future: Future[Dict[str, object]], layers: Sequence[Layer], T_inf: float
+        ) -> None:
+            if not future.done():
+                self.root.after(30, self._poll_calculation, future, layers, T_inf)
+                return
+
+            self.btn_calculate.configure(state="normal")
             try:
-                if any(layer.use_kT for layer in layers):
-                    result = solve_multilayer_kT(layers, T_left, T_inf, h_value)
-                else:
-                    result = compute_multilayer_layers(layers, T_left, T_inf, h_value)
+                result = future.result()
             except Exception as exc:
                 messagebox.showerror("Berechnungsfehler", str(exc))
                 return
 
             self._display_result(layers, result, T_inf)
-            self._update_plot(layers, result)
+            self.root.after_idle(self._update_plot, layers, result)
 
         def _display_result(
             self, layers: Sequence[Layer], result: Dict[str, object], T_inf: float
@@ -1295,44 +1990,131 @@ def run_ui() -> None:
             return f"Schicht {index + 1}"
 
         def _update_plot(self, layers: Sequence[Layer], result: Dict[str, object]) -> None:
-            x_values = result.get("x_m")
-            temps = result.get("T_profile_C")
-            if not isinstance(x_values, Sequence) or not isinstance(temps, Sequence):
+            try:
+                x_values = np.asarray(result.get("x_m"), dtype=np.float64)
+                temps = np.asarray(result.get("T_profile_C"), dtype=np.float64)
+            except (TypeError, ValueError):
+                return
+            if x_values.ndim != 1 or temps.ndim != 1:
+                return
+            if x_values.shape != temps.shape:
+                # Runs from after_idle, where an exception would only reach stderr.
+                messagebox.showerror(
+                    "Berechnungsfehler",
+                    "Das Temperaturprofil kann nicht dargestellt werden: "
+                    "x und T haben unterschiedliche Längen.",
+                )
                 return
 
-            self.plot_ax.clear()
-            self.plot_ax.set_xlabel("x [m]")
-            self.plot_ax.set_ylabel("T [°C]")
-            self.plot_ax.grid(True, linestyle="--", alpha=0.4)
+            labels = [self._layer_label(layer, idx) for idx, layer in enumerate(layers)]
+            layer_key = tuple(zip((layer.thickness_mm for layer in layers), labels))
 
-            (line,) = self.plot_ax.plot(x_values, temps, color="tab:red", label="Temperaturprofil")
+            # Identical input (e.g. pressing "Berechnen" twice) is already on screen.
+            plot_key = (layer_key, x_values.tobytes(), temps.tobytes())
+            if plot_key == self._plot_key:
+                return
+            self._plot_key = plot_key
+
+            if not self._plot_ready:
+                self._build_plot()
+            self.plot_line.set_data(x_values, temps)
+            if layer_key != self._plot_layer_key:
+                self._rebuild_plot_background(layers, labels, layer_key)
+            self._update_plot_line()
+
+        def _update_plot_line(self) -> None:
+            """Blit the profile line over the cached background; redraw fully if that is stale."""
+
+            if self._plot_background is not None:
+                limits = _axes_limits(self.plot_ax)
+                self.plot_ax.relim()
+                self.plot_ax.autoscale_view()
+                if _limits_close(limits, _axes_limits(self.plot_ax)):
+                    self.plot_canvas.restore_region(self._plot_background)
+                    self._draw_plot_overlay()
+                    self.plot_canvas.blit(self.plot_ax.bbox)
+                    return
+                self._plot_background = None
+            # _on_plot_draw captures the new background once the redraw has happened.
+            self.plot_canvas.draw_idle()
+
+        def _rebuild_plot_background(
+            self, layers: Sequence[Layer], labels: Sequence[str], layer_key: Tuple[object, ...]
+        ) -> None:
+            """Replace the layer decoration (boundaries, spans, legend) for a new layer stack."""
 
-            boundaries = [0.0]
-            for layer in layers:
-                boundaries.append(boundaries[-1] + layer.thickness_mm / 1000.0)
+            from matplotlib.collections import QuadMesh
+            from matplotlib.patches import Patch
 
-            for boundary in boundaries[1:-1]:
-                self.plot_ax.axvline(boundary, color="gray", linestyle="--", alpha=0.6)
+            # Keep axes, labels and the profile line; only the layer decoration is rebuilt.
+            self._plot_layer_key = layer_key
+            self._plot_background = None
+            for artist in self.plot_layer_artists:
+                artist.remove()
+            self.plot_layer_artists = []
 
-            cmap = cm.get_cmap("tab20", max(len(layers), 1))
-            legend_handles = [line]
-            for idx, layer in enumerate(layers):
-                color = cmap(idx)
-                left = boundaries[idx]
-                right = boundaries[idx + 1]
-                self.plot_ax.axvspan(left, right, color=color, alpha=0.15)
-                legend_handles.append(
-                    Patch(facecolor=color, edgecolor="none", label=self._layer_label(layer, idx))
+            thicknesses_m = (
+                np.fromiter(
+                    (layer.thickness_mm for layer in layers), dtype=np.float64, count=len(layers)
                 )
+                / 1000.0
+            )
+            boundaries = np.concatenate(([0.0], np.cumsum(thicknesses_m)))
 
-            self.plot_ax.legend(handles=legend_handles, loc="best")
-            self.plot_figure.tight_layout()
-            self.plot_canvas.draw_idle()
+            for boundary in boundaries[1:-1].tolist():
+                self.plot_layer_artists.append(
+                    self.plot_ax.axvline(boundary, color="gray", linestyle="--", alpha=0.6)
+                )
+
+            # All layer spans form one 1 x N quad mesh over the full axes height.
+            colors = _layer_colors(len(layers))
+            coordinates = np.empty((2, len(boundaries), 2))
+            coordinates[:, :, 0] = boundaries
+            coordinates[0, :, 1] = 0.0
+            coordinates[1, :, 1] = 1.0
+            spans = QuadMesh(
+                coordinates,
+                facecolors=colors,
+                alpha=0.15,
+                transform=self.plot_ax.get_xaxis_transform(),
+            )
+            self.plot_ax.add_collection(spans, autolim=False)
+            self.plot_layer_artists.append(spans)
+
+            self.plot_ax.relim()
+            self.plot_ax.autoscale_view()
+
+            # Colours only depend on the layer count, so equal labels mean an equal legend.
+            legend_key = tuple(labels)
+            if legend_key != self._legend_key:
+                self._legend_key = legend_key
+                legend_handles = [self.plot_line]
+                for color, label in zip(colors, labels):
+                    legend_handles.append(Patch(facecolor=color, edgecolor="none", label=label))
+                # Fixed corner and animated, so it is drawn over the blitted line.
+                self._plot_legend = self.plot_ax.legend(handles=legend_handles, loc="upper right")
+                self._plot_legend.set_animated(True)
+
+        def _on_plot_draw(self, _event: object) -> None:
+            # Runs after every full redraw (including resizes).
+            self._plot_background = self.plot_canvas.copy_from_bbox(self.plot_ax.bbox)
+            self._draw_plot_overlay()
+
+        def _draw_plot_overlay(self) -> None:
+            self.plot_ax.draw_artist(self.plot_line)
+            if self._plot_legend is not None:
+                self.plot_ax.draw_artist(self._plot_legend)
 
         def _set_output_text(self, text: str) -> None:
+            self._pending_output_text = text
+            self._run_when_idle(self._write_output_text)
+
+        def _write_output_text(self) -> None:
+            text, self._pending_output_text = self._pending_output_text, None
+            if text is None:
+                return
             self.output_text.configure(state="normal")
-            self.output_text.delete("1.0", tk.END)
-            self.output_text.insert(tk.END, text)
+            self.output_text.replace("1.0", "end-1c", text)
             self.output_text.configure(state="disabled")
 
         # ------------------------------------------------------------------
@@ -1382,12 +2164,33 @@ def run_ui() -> None:
             ttk.Button(dialog, text="Abbrechen", command=dialog.destroy).pack(padx=10, pady=(0, 10))
 
         def _apply_project(self, project: Project) -> None:
+            with _batched_tree_update(self.tree):
+                self._apply_project_rows(project)
+
+        def _apply_project_rows(self, project: Project) -> None:
             self.refresh_material_options()
 
             self.T_left_var.set(f"{project.T_left_C:g}")
             self.T_inf_var.set(f"{project.T_inf_C:g}")
             self.h_var.set(f"{project.h_W_m2K:g}")
 
+            lookup = self.material_lookup
+            missing_ids = {
+                layer.material_id
+                for layer in project.layers
+                if layer.mode == "material" and layer.material_id is not None
+            } - lookup.keys()
+            if missing_ids:
+                try:
+                    lookup.update(get_materials(missing_ids))
+                except sqlite3.Error:
+                    # Retry one by one so a single bad id does not hide the others.
+                    for material_id in missing_ids:
+                        try:
+                            lookup[material_id] = get_material(material_id)
+                        except (KeyError, sqlite3.Error):
+                            pass
+
             rows: List[Dict[str, object]] = []
             for layer in project.layers:
                 row: Dict[str, object] = {
@@ -1400,87 +2203,135 @@ def run_ui() -> None:
                     "note": layer.note or "",
                 }
                 if layer.mode == "material" and layer.material_id is not None:
-                    material = self.material_lookup.get(layer.material_id)
-                    if material is None:
-                        try:
-                            material = get_material(layer.material_id)
-                            self.material_lookup[layer.material_id] = material
-                        except Exception:
-                            material = None
-                    if material is not None:
-                        row["material_name"] = material.name
+                    material = lookup.get(layer.material_id)
+                    # Same fallback label as the result output for materials that are gone.
+                    row["material_name"] = (
+                        material.name if material is not None else f"Material {layer.material_id}"
+                    )
                 else:
                     if layer.k_const is not None:
                         row["k_const"] = f"{layer.k_const:g}"
                 rows.append(row)
 
-            self.layer_rows = rows
+            self.layer_rows.clear()
+            self.layer_rows.extend(rows)
             self.refresh_tree(select_index=0 if self.layer_rows else None)
 
         def open_save_dialog(self) -> None:
+            if self._save_dialog is None:
+                self._build_save_dialog()
+            dialog = self._save_dialog
+            self._save_session += 1
+            if self._save_close_after_id is not None:
+                dialog.after_cancel(self._save_close_after_id)
+                self._save_close_after_id = None
+            self._save_name_var.set("")
+            self._save_status_var.set("")
+            self._save_status_label.configure(foreground="red")
+            dialog.deiconify()
+            dialog.grab_set()
+            self._save_entry.focus_set()
+
+        def _build_save_dialog(self) -> None:
             dialog = tk.Toplevel(self.root)
+            dialog.withdraw()
             dialog.title("Als Projekt speichern")
             dialog.transient(self.root)
-            dialog.grab_set()
+            dialog.protocol("WM_DELETE_WINDOW", self._hide_save_dialog)
 
             ttk.Label(dialog, text="Projektname:").pack(padx=10, pady=(10, 0))
 
-            name_var = tk.StringVar()
-            entry = ttk.Entry(dialog, textvariable=name_var)
-            entry.pack(padx=10, pady=5, fill="x")
-            entry.focus_set()
-
-            status_var = tk.StringVar()
-            status_label = ttk.Label(dialog, textvariable=status_var, foreground="red")
-            status_label.pack(padx=10, pady=(0, 5), fill="x")
+            self._save_name_var = tk.StringVar()
+            self._save_entry = ttk.Entry(dialog, textvariable=self._save_name_var)
+            self._save_entry.pack(padx=10, pady=5, fill="x")
+
+            self._save_status_var = tk.StringVar()
+            self._save_status_label = ttk.Label(dialog, textvariable=self._save_status_var, foreground="red")
+            self._save_status_label.pack(padx=10, pady=(0, 5), fill="x")
+
+            self._save_button = ttk.Button(dialog, text="Speichern", command=self._on_save_project)
+            self._save_button.pack(padx=10, pady=(0, 5))
+            ttk.Button(dialog, text="Abbrechen", command=self._hide_save_dialog).pack(padx=10, pady=(0, 10))
+            self._save_dialog = dialog
+
+        def _hide_save_dialog(self) -> None:
+            self._save_close_after_id = None
+            if self._save_dialog is not None:
+                self._save_dialog.grab_release()
+                self._save_dialog.withdraw()
+
+        def _on_save_project(self) -> None:
+            # Validation problems go to the status line, not to a message box.
+            status_var = self._save_status_var
+            self._save_status_label.configure(foreground="red")
+            name = self._save_name_var.get().strip()
+            if not name:
+                status_var.set("Bitte einen Projektnamen eingeben.")
+                return
+            try:
+                T_left, T_inf, h_value = self._parse_boundary_conditions()
+            except ValueError as exc:
+                status_var.set(str(exc))
+                return
 
-            def on_save() -> None:
-                name = name_var.get().strip()
-                if not name:
-                    status_var.set("Bitte einen Projektnamen eingeben.")
-                    return
-                try:
-                    T_left, T_inf, h_value = self._parse_boundary_conditions()
-                except ValueError as exc:
-                    status_var.set(str(exc))
-                    messagebox.showerror("Validierungsfehler", str(exc))
-                    return
+            self.refresh_material_options()
+            self._cancel_validation()
+            # The first problem is enough to refuse the save; "Alles prüfen" lists all of them.
+            layers, errors, error_indices = self._collect_layers(fail_fast=True)
+            if errors:
+                self._highlight_errors(error_indices)
+                status_var.set("\n".join(errors[:3]))
+                return
 
-                self.refresh_material_options()
-                layers, errors, error_indices = self._collect_layers()
-                if errors:
-                    self._highlight_errors(error_indices)
-                    messagebox.showerror("Validierungsfehler", "\n".join(errors))
-                    status_var.set(errors[0])
-                    return
+            project = Project(
+                name=name,
+                layers=layers,
+                T_left_C=T_left,
+                T_inf_C=T_inf,
+                h_W_m2K=h_value,
+            )
 
-                project = Project(
-                    name=name,
-                    layers=layers,
-                    T_left_C=T_left,
-                    T_inf_C=T_inf,
-                    h_W_m2K=h_value,
-                )
+            self._save_button.configure(state="disabled")
+            status_var.set("")
+            future = self._save_executor.submit(save_project, project)
+            self.root.after(50, self._poll_save, future, name, self._save_session)
 
-                try:
-                    save_project(project)
-                except Exception as exc:
-                    status_var.set(str(exc))
-                    messagebox.showerror("Fehler", str(exc))
-                    return
+        def _poll_save(self, future: Future[None], name: str, session: int) -> None:
+            if not future.done():
+                self.root.after(50, self._poll_save, future, name, session)
+                return
+            self._save_button.configure(state="normal")
+            error = future.exception()
+            if session != self._save_session or not self._save_dialog.winfo_viewable():
+                # The dialog was closed (or reopened) while saving.
+                if error is not None:
+                    messagebox.showerror("Fehler", str(error))
+                else:
+                    messagebox.showinfo("Erfolg", f"Projekt '{name}' gespeichert.")
+                return
+            if error is not None:
+                self._save_status_var.set(str(error))
+                messagebox.showerror("Fehler", str(error))
+                return
 
-                status_label.configure(foreground="green")
-                status_var.set(f"Projekt '{name}' gespeichert.")
-                dialog.after(1500, dialog.destroy)
+            self._save_status_label.configure(foreground="green")
+            self._save_status_var.set(f"Projekt '{name}' gespeichert.")
+            self._save_close_after_id = self._save_dialog.after(1500, self._hide_save_dialog)
 
-            ttk.Button(dialog, text="Speichern", command=on_save).pack(padx=10, pady=(0, 5))
-            ttk.Button(dialog, text="Abbrechen", command=dialog.destroy).pack(padx=10, pady=(0, 10))
+        def close(self) -> None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            # A save that is still running must finish before the database is closed.
+            self._save_executor.shutdown(wait=True)
 
         def on_tab_changed(self, event: tk.Event) -> None:
             selected = event.widget.select()
             if selected == str(self.frame):
+                # Edits on the material tab bump materials_version(); otherwise this is a no-op.
                 self.refresh_material_options()
 
+    # Overlap matplotlib's cold start with Tk initialisation.
+    threading.Thread(target=_preload_matplotlib, daemon=True).start()
+
     root = tk.Tk()
     root.title("Heatrix - Isolierung - Temperaturberechnung")
 
@@ -1492,5 +2343,9 @@ def run_ui() -> None:
 
     MaterialTab(notebook)
 
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        calculation_tab.close()
+        close_database()
 
@@ -0,0 +1,144 @@
+import sqlite3
+
+import pytest
+
+import Isolierung_logic as logic
+from Isolierung_logic import Layer, Project
+
+
+@pytest.fixture(autouse=True)
+def temp_db(tmp_path, monkeypatch):
+    path = tmp_path / "test.db"
+    monkeypatch.setattr(logic, "_DB_PATH", str(path))
+    monkeypatch.setattr(logic, "_DB_INITIALIZED", False)
+    return path
+
+
+def _project(name: str) -> Project:
+    return Project(
+        name=name,
+        layers=[Layer(thickness_mm=10.0, mode="custom", k_const=0.04)],
+        T_left_C=400.0,
+        T_inf_C=20.0,
+        h_W_m2K=10.0,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Project names cache
+# ---------------------------------------------------------------------------
+
+
+def test_project_names_follow_saves():
+    logic.save_project(_project("B"))
+    assert logic.get_all_project_names() == ["B"]
+    logic.save_project(_project("A"))
+    assert logic.get_all_project_names() == ["A", "B"]
+
+
+def test_project_names_not_cached_across_databases(tmp_path, monkeypatch):
+    logic.save_project(_project("first"))
+    assert logic.get_all_project_names() == ["first"]
+
+    monkeypatch.setattr(logic, "_DB_PATH", str(tmp_path / "other.db"))
+    monkeypatch.setattr(logic, "_DB_INITIALIZED", False)
+    assert logic.get_all_project_names() == []
+
+
+def test_project_names_read_before_concurrent_save_are_not_cached(monkeypatch):
+    logic.save_project(_project("old"))
+    get_connection = logic._get_connection
+
+    class SaveAfterSelect:
+        """Connection whose exit simulates a save that commits after the SELECT ran."""
+
+        def __init__(self):
+            self.conn = get_connection()
+
+        def __enter__(self):
+            return self.conn.__enter__()
+
+        def __exit__(self, *exc):
+            result = self.conn.__exit__(*exc)
+            with get_connection() as other:
+                other.execute(
+                    "INSERT INTO projects (name, layers_json, T_left_C, T_inf_C, h_W_m2K) "
+                    "VALUES ('new', '[]', 0, 0, 1)"
+                )
+            logic._invalidate_project_names()
+            return result
+
+    logic._invalidate_project_names()
+    monkeypatch.setattr(logic, "_get_connection", SaveAfterSelect)
+    assert logic.get_all_project_names() == ["old"]
+    monkeypatch.setattr(logic, "_get_connection", get_connection)
+    assert logic.get_all_project_names() == ["new", "old"]
+
+
+# ---------------------------------------------------------------------------
+# Database shutdown
+# ---------------------------------------------------------------------------
+
+
+def test_close_database_removes_wal_files(temp_db):
+    logic.save_project(_project("P"))
+    logic.close_database()
+
+    assert not temp_db.with_name(temp_db.name + "-wal").exists()
+    assert not temp_db.with_name(temp_db.name + "-shm").exists()
+    with sqlite3.connect(temp_db) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert logic.get_all_project_names() == ["P"]
+
+
+# ---------------------------------------------------------------------------
+# Materials
+# ---------------------------------------------------------------------------
+
+
+def test_get_materials_skips_duplicate_and_missing_ids():
+    first = logic.create_material("A", k_const=0.04)
+    second = logic.create_material("B")
+
+    materials = logic.get_materials([second, first, second, first + second + 100])
+
+    assert sorted(materials) == [first, second]
+    assert materials[first].name == "A"
+    assert materials[first].k_const == 0.04
+    assert materials[second].k_points == []
+    assert logic.get_materials([]) == {}
+
+
+def test_get_materials_returns_k_points_sorted_by_temperature():
+    material_id = logic.create_material("A")
+    logic.upsert_k_points(material_id, [(400.0, 0.08), (20.0, 0.04), (200.0, 0.06)])
+
+    materials = logic.get_materials([material_id])
+
+    assert materials[material_id].k_points == [(20.0, 0.04), (200.0, 0.06), (400.0, 0.08)]
+    assert materials[material_id].k_points == logic.get_material(material_id).k_points
+
+
+def test_materials_version_increases_on_every_write():
+    versions = [logic.materials_version()]
+    material_id = logic.create_material("A")
+    versions.append(logic.materials_version())
+    logic.update_material(material_id, k_const=0.05)
+    versions.append(logic.materials_version())
+    logic.upsert_k_points(material_id, [(20.0, 0.04)])
+    versions.append(logic.materials_version())
+    logic.delete_material(material_id)
+    versions.append(logic.materials_version())
+
+    assert versions == sorted(set(versions))
+
+
+def test_materials_version_unchanged_when_nothing_was_written():
+    material_id = logic.create_material("A")
+    logic.delete_material(material_id)
+    version = logic.materials_version()
+
+    assert logic.delete_material(material_id) is False
+    assert logic.update_material(material_id, name="B") is False
+    assert logic.update_material(material_id) is False
+    assert logic.materials_version() == version
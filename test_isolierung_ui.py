@@ -0,0 +1,99 @@
+import math
+
+import pytest
+
+from Isolierung_ui import _LAYER_COLUMNS, _LayerRows, _refit_range
+
+
+# ---------------------------------------------------------------------------
+# Plot limits
+# ---------------------------------------------------------------------------
+
+
+def test_refit_range_keeps_view_that_still_fits():
+    assert _refit_range((0.0, 100.0), 10.0, 90.0) is None
+
+
+@pytest.mark.parametrize("low, high", [(-10.0, 50.0), (50.0, 110.0)])
+def test_refit_range_refits_when_data_leaves_view(low, high):
+    span = high - low
+    assert _refit_range((0.0, 100.0), low, high) == pytest.approx((low - 0.1 * span, high + 0.1 * span))
+
+
+def test_refit_range_refits_when_data_shrinks_below_half_of_view():
+    # Padded range 48 of 100 -> refit; padded range 60 of 100 -> keep.
+    assert _refit_range((0.0, 100.0), 40.0, 80.0) == pytest.approx((36.0, 84.0))
+    assert _refit_range((0.0, 100.0), 25.0, 75.0) is None
+
+
+def test_refit_range_pads_a_single_value():
+    assert _refit_range((0.0, 1.0), 50.0, 50.0) == pytest.approx((45.0, 55.0))
+    assert _refit_range((5.0, 6.0), 0.0, 0.0) == pytest.approx((-1.0, 1.0))
+
+
+@pytest.mark.parametrize(
+    "low, high",
+    [
+        (0.0, math.inf),
+        (-math.inf, 0.0),
+        (0.0, math.nan),
+        (-1e308, 1e308),
+    ],
+)
+def test_refit_range_keeps_view_for_non_finite_range(low, high):
+    assert _refit_range((0.0, 100.0), low, high) is None
+
+
+# ---------------------------------------------------------------------------
+# Layer table storage
+# ---------------------------------------------------------------------------
+
+
+def _rows(*thicknesses: str) -> _LayerRows:
+    rows = _LayerRows()
+    rows.extend({"mode": "custom", "thickness": thickness} for thickness in thicknesses)
+    return rows
+
+
+def test_layer_rows_fill_missing_columns_with_defaults():
+    rows = _LayerRows()
+    rows.append({"mode": "custom", "k_const": "0,04"})
+
+    assert len(rows) == 1
+    assert all(len(column) == 1 for column in rows.columns.values())
+    assert rows[0]["k_const"] == "0,04"
+    for name, default in _LAYER_COLUMNS.items():
+        if name not in ("mode", "k_const"):
+            assert rows[0][name] == default
+
+
+def test_layer_row_view_reads_and_writes_columns():
+    rows = _rows("10", "20")
+
+    rows[1]["thickness"] = "25"
+
+    assert rows.columns["thickness"] == ["10", "25"]
+    assert rows[0].get("thickness") == "10"
+    assert rows[0].get("unknown", "fallback") == "fallback"
+    assert [row["thickness"] for row in rows] == ["10", "25"]
+    with pytest.raises(IndexError):
+        rows[2]
+    with pytest.raises(IndexError):
+        rows[-1]
+
+
+def test_layer_rows_swap_delete_and_clear_keep_columns_aligned():
+    rows = _rows("1", "2", "3")
+    rows[0]["_thickness_parsed"] = 1.0
+
+    rows.swap(0, 2)
+    assert rows.columns["thickness"] == ["3", "2", "1"]
+    assert rows.columns["_thickness_parsed"] == [None, None, 1.0]
+
+    del rows[1]
+    assert rows.columns["thickness"] == ["3", "1"]
+    assert all(len(column) == 2 for column in rows.columns.values())
+
+    rows.clear()
+    assert len(rows) == 0
+    assert all(column == [] for column in rows.columns.values())